@@ -0,0 +1,91 @@
+import asyncio
+import time
+from typing import Any, Callable, Optional
+
+from generic_search import Node, SearchSteps, iter_astar, iter_xfs, node_to_path
+from maze import Maze, manhattan_distance
+
+
+async def async_search(
+    steps: SearchSteps, timeout: Optional[float] = None
+) -> Optional[Node]:
+    """Drive an iter_* search, yielding to the event loop after every chunk
+
+    Cancelling the awaiting task, or exceeding timeout (seconds, raising
+    asyncio.TimeoutError), stops the search and closes the generator.
+    """
+
+    async def drive() -> Optional[Node]:
+        while True:
+            try:
+                next(steps)
+            except StopIteration as done:
+                return done.value
+            await asyncio.sleep(0)
+
+    try:
+        if timeout is None:
+            return await drive()
+        return await asyncio.wait_for(drive(), timeout)
+    finally:
+        steps.close()
+
+
+async def async_bfs(
+    initial: Any,
+    goal_test: Callable,
+    successors: Callable,
+    chunk: int = 1000,
+    timeout: Optional[float] = None,
+) -> Optional[Node]:
+    steps: SearchSteps = iter_xfs(initial, goal_test, successors, True, chunk)
+    return await async_search(steps, timeout)
+
+
+async def async_dfs(
+    initial: Any,
+    goal_test: Callable,
+    successors: Callable,
+    chunk: int = 1000,
+    timeout: Optional[float] = None,
+) -> Optional[Node]:
+    steps: SearchSteps = iter_xfs(initial, goal_test, successors, False, chunk)
+    return await async_search(steps, timeout)
+
+
+async def async_astar(
+    initial: Any,
+    goal_test: Callable,
+    successors: Callable,
+    heuristic: Callable,
+    chunk: int = 1000,
+    timeout: Optional[float] = None,
+) -> Optional[Node]:
+    steps: SearchSteps = iter_astar(initial, goal_test, successors, heuristic, chunk)
+    return await async_search(steps, timeout)
+
+
+async def _ticker(interval: float) -> None:
+    while True:
+        print(f"Event loop still responsive at {time.strftime('%X')}")
+        await asyncio.sleep(interval)
+
+
+async def _main() -> None:
+    m = Maze(num_rows=300, num_columns=300, sparseness=0.2)
+    ticker = asyncio.create_task(_ticker(0.1))
+    start = time.time()
+    node = await async_astar(
+        m.start, m.is_goal, m.successors, manhattan_distance(m.goal), chunk=500
+    )
+    end = time.time()
+    ticker.cancel()
+    print(f"Path length: {len(node_to_path(node))}, Time: {end - start}")
+    try:
+        await async_bfs(m.start, m.is_goal, m.successors, timeout=0.01)
+    except asyncio.TimeoutError:
+        print("BFS cancelled after 0.01s")
+
+
+if __name__ == "__main__":
+    asyncio.run(_main())
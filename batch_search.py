@@ -0,0 +1,131 @@
+from array import array
+from multiprocessing import Pool, cpu_count
+import random
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, TypeVar, Union
+
+from csr_graph import CSRGraph, WeightedCSRGraph
+from dijkstra import dijkstra, path_to
+from generic_search import bfs, node_to_path
+from graph import Graph
+from path_cache import bfs_tree
+
+
+V = TypeVar("V")
+
+# Frozen graph shared by pool workers; set once per worker by _init_worker, so
+# with the fork start method it is inherited rather than pickled at all
+_worker_graph: Optional[CSRGraph] = None
+
+
+def _init_worker(graph: CSRGraph) -> None:
+    global _worker_graph
+    _worker_graph = graph
+
+
+def _bfs_path(graph: CSRGraph, start: int, goal: int) -> List:
+    node = bfs(start, goal.__eq__, graph.neighbor_indices, low_memory=True)
+    return [graph.vertex_at(i) for i in node_to_path(node)]
+
+
+def _dijkstra_path(
+    graph: CSRGraph, start: int, goal: int
+) -> Tuple[Optional[float], List]:
+    if not isinstance(graph, WeightedCSRGraph):  # unit weights
+        path: List = _bfs_path(graph, start, goal)
+        return (float(len(path) - 1), path) if path else (None, [])
+    distances, predecessors = dijkstra(graph, start, goal)
+    if distances[goal] is None:
+        return None, []
+    return distances[goal], [graph.vertex_at(i) for i in path_to(predecessors, goal)]
+
+
+_ALGORITHMS: Dict[str, Callable] = {"bfs": _bfs_path, "dijkstra": _dijkstra_path}
+
+
+def _run_pair(task: Tuple[str, int, int]) -> Any:
+    algorithm, start, goal = task
+    return _ALGORITHMS[algorithm](_worker_graph, start, goal)
+
+
+def _run_source(source: int) -> array:
+    return bfs_tree(_worker_graph, source)[0]
+
+
+def _map(
+    graph: CSRGraph, function: Callable, tasks: List, workers: Optional[int]
+) -> List:
+    if workers is None:
+        workers = cpu_count()
+    if workers <= 1 or len(tasks) <= 1:
+        _init_worker(graph)
+        try:
+            return list(map(function, tasks))
+        finally:
+            _init_worker(None)
+    chunksize: int = max(1, len(tasks) // (workers * 4))
+    with Pool(workers, initializer=_init_worker, initargs=(graph,)) as pool:
+        return pool.map(function, tasks, chunksize)
+
+
+def batch_search(
+    graph: Union[Graph[V], CSRGraph[V]],
+    pairs: Sequence[Tuple[V, V]],
+    algorithm: str = "bfs",
+    workers: Optional[int] = None,
+) -> List:
+    """Answer many (start, goal) vertex queries over one graph in parallel
+
+    The graph is frozen once and handed to each worker when the pool starts,
+    never per query. Results come back in the order of pairs: vertex paths
+    for "bfs" ([] if unreachable), (distance, path) tuples for "dijkstra".
+    "dijkstra" over an unweighted graph counts each edge as weight 1.
+    workers defaults to the CPU count; 1 runs in this process.
+    """
+    if algorithm not in _ALGORITHMS:
+        raise ValueError(f"Unknown algorithm '{algorithm}'")
+    frozen: CSRGraph[V] = graph.freeze()
+    tasks: List[Tuple[str, int, int]] = [
+        (algorithm, frozen.index_of(start), frozen.index_of(goal))
+        for start, goal in pairs
+    ]
+    return _map(frozen, _run_pair, tasks, workers)
+
+
+def multi_source_bfs(
+    graph: Union[Graph[V], CSRGraph[V]],
+    sources: Optional[Sequence[V]] = None,
+    workers: Optional[int] = None,
+) -> List[array]:
+    """Hop distances from each source vertex, or every vertex if sources is None
+
+    Entry i of the result holds the distances from sources[i], indexed by
+    vertex index, with -1 where unreachable.
+    """
+    frozen: CSRGraph[V] = graph.freeze()
+    if sources is None:
+        tasks: List[int] = list(range(frozen.vertex_count))
+    else:
+        tasks = [frozen.index_of(source) for source in sources]
+    return _map(frozen, _run_source, tasks, workers)
+
+
+if __name__ == "__main__":
+    random.seed(0)
+    vertex_count: int = 20_000
+    graph: Graph[int] = Graph.from_edges(
+        (
+            (random.randrange(vertex_count), random.randrange(vertex_count))
+            for _ in range(100_000)
+        ),
+        range(vertex_count),
+    )
+    pairs = [
+        (random.randrange(vertex_count), random.randrange(vertex_count))
+        for _ in range(100)
+    ]
+    for workers in (1, cpu_count()):
+        start = time.time()
+        paths = batch_search(graph, pairs, workers=workers)
+        end = time.time()
+        print(f"{len(paths)} bfs queries, {workers} worker(s), Time: {end - start}")
@@ -0,0 +1,276 @@
+"""Reproducible timings for the project's hot paths
+
+    python benchmarks.py --output baseline.json
+    python benchmarks.py --compare baseline.json
+
+Every benchmark builds its input from a fixed seed, then records the best
+wall time over several repeats, the peak traced memory of one extra run and,
+for searches, the number of states expanded. Results are written as JSON;
+--compare flags benchmarks that got slower than the baseline by more than
+--threshold and exits with status 1 if any did.
+"""
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from dna_search import binary_contains, linear_contains, str_to_codon, str_to_gene
+from generic_search import astar, bfs, dfs
+from graph import Graph
+from maze import Maze, manhattan_distance
+from mst import mst
+from trivial_compression import CompressedGene, random_gene
+from unbreakable_encryption import decrypt, encrypt
+from weighted_graph import WeightedGraph
+
+
+# A benchmark's setup returns a zero-argument callable to time; the callable
+# returns the number of states expanded, or None where that does not apply
+Setup = Callable[[], Callable[[], Optional[int]]]
+
+
+class _Counter:
+    """Wraps successors to count expansions"""
+
+    def __init__(self, successors: Callable) -> None:
+        self.successors: Callable = successors
+        self.count: int = 0
+
+    def __call__(self, state: Any) -> Any:
+        self.count += 1
+        return self.successors(state)
+
+
+def _maze_search(name: str, size: int, sparseness: float) -> Setup:
+    def setup() -> Callable[[], Optional[int]]:
+        maze: Maze = Maze(num_rows=size, num_columns=size, sparseness=sparseness)
+
+        def run() -> int:
+            successors: _Counter = _Counter(maze.successors)
+            if name == "astar":
+                heuristic: Callable = manhattan_distance(maze.goal)
+                astar(maze.start, maze.is_goal, successors, heuristic)
+            else:
+                search: Callable = dfs if name == "dfs" else bfs
+                search(maze.start, maze.is_goal, successors)
+            return successors.count
+
+        return run
+
+    return setup
+
+
+def _random_edges(vertex_count: int, edge_count: int) -> List[Tuple[int, int]]:
+    return [
+        (random.randrange(vertex_count), random.randrange(vertex_count))
+        for _ in range(edge_count)
+    ]
+
+
+def _graph_construction(vertex_count: int, edge_count: int) -> Setup:
+    def setup() -> Callable[[], None]:
+        edges: List[Tuple[int, int]] = _random_edges(vertex_count, edge_count)
+
+        def run() -> None:
+            Graph.from_edges(edges, range(vertex_count))
+
+        return run
+
+    return setup
+
+
+def _graph_bfs(vertex_count: int, edge_count: int) -> Setup:
+    def setup() -> Callable[[], int]:
+        graph: Graph[int] = Graph.from_edges(
+            _random_edges(vertex_count, edge_count), range(vertex_count)
+        )
+        goal: int = vertex_count - 1
+
+        def run() -> int:
+            successors: _Counter = _Counter(graph.neighbors_for_vertex)
+            bfs(0, goal.__eq__, successors)
+            return successors.count
+
+        return run
+
+    return setup
+
+
+def _mst(vertex_count: int, edge_count: int) -> Setup:
+    def setup() -> Callable[[], None]:
+        graph: WeightedGraph[int] = WeightedGraph.from_edges(
+            (
+                (u, v, random.random())
+                for u, v in _random_edges(vertex_count, edge_count)
+            ),
+            range(vertex_count),
+        )
+
+        def run() -> None:
+            mst(graph)
+
+        return run
+
+    return setup
+
+
+def _compression(length: int, direction: str) -> Setup:
+    def setup() -> Callable[[], None]:
+        gene: str = random_gene(length)
+        compressed: CompressedGene = CompressedGene(gene)
+
+        def run() -> None:
+            if direction == "compress":
+                CompressedGene(gene)
+            else:
+                str(compressed)
+
+        return run
+
+    return setup
+
+
+def _contains(length: int, method: str) -> Setup:
+    def setup() -> Callable[[], None]:
+        gene = str_to_gene(random_gene(length))
+        sorted_gene = sorted(gene)
+        keys = [str_to_codon(random_gene(3)) for _ in range(100)]
+
+        def run() -> None:
+            for key in keys:
+                if method == "linear":
+                    linear_contains(gene, key)
+                else:
+                    binary_contains(sorted_gene, key)
+
+        return run
+
+    return setup
+
+
+def _encryption(length: int, direction: str) -> Setup:
+    def setup() -> Callable[[], None]:
+        message: str = random_gene(length)
+        cipher, key = encrypt(message)
+
+        def run() -> None:
+            if direction == "encrypt":
+                encrypt(message)
+            else:
+                decrypt(cipher, key)
+
+        return run
+
+    return setup
+
+
+def benchmarks(quick: bool = False) -> Iterator[Tuple[str, Setup]]:
+    maze_sizes: List[int] = [20, 60] if quick else [20, 60, 150]
+    for size in maze_sizes:
+        for sparseness in (0.1, 0.3):
+            for name in ("dfs", "bfs", "astar"):
+                yield (
+                    f"maze_{name}_{size}x{size}_{sparseness}",
+                    _maze_search(name, size, sparseness),
+                )
+    graph_sizes: List[int] = [1_000, 10_000] if quick else [1_000, 10_000, 100_000]
+    for vertex_count in graph_sizes:
+        edge_count: int = vertex_count * 4
+        yield (
+            f"graph_from_edges_{vertex_count}",
+            _graph_construction(vertex_count, edge_count),
+        )
+        yield f"graph_bfs_{vertex_count}", _graph_bfs(vertex_count, edge_count)
+        yield f"mst_{vertex_count}", _mst(vertex_count, edge_count)
+    gene_lengths: List[int] = [1_000, 10_000] if quick else [1_000, 10_000, 100_000]
+    for length in gene_lengths:
+        for direction in ("compress", "decompress"):
+            yield f"gene_{direction}_{length}", _compression(length, direction)
+        for method in ("linear", "binary"):
+            yield f"dna_{method}_contains_{length}", _contains(length, method)
+        for direction in ("encrypt", "decrypt"):
+            yield f"{direction}_{length}", _encryption(length, direction)
+
+
+def run_benchmark(setup: Setup, seed: int, repeat: int) -> Dict[str, Any]:
+    random.seed(seed)
+    run: Callable[[], Optional[int]] = setup()
+    best: float = float("inf")
+    nodes_expanded: Optional[int] = None
+    for _ in range(repeat):
+        start: float = time.perf_counter()
+        nodes_expanded = run()
+        best = min(best, time.perf_counter() - start)
+    tracemalloc.start()
+    try:
+        run()
+        peak_memory: int = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return {
+        "time": best,
+        "peak_memory": peak_memory,
+        "nodes_expanded": nodes_expanded,
+    }
+
+
+def compare(
+    results: Dict[str, Dict], baseline: Dict[str, Dict], threshold: float
+) -> List[str]:
+    """Names of benchmarks whose time grew by more than threshold (a ratio)"""
+    regressions: List[str] = []
+    for name, result in results.items():
+        previous: Optional[Dict] = baseline.get(name)
+        if previous is None or previous["time"] <= 0:
+            continue
+        ratio: float = result["time"] / previous["time"]
+        flag: str = "REGRESSION" if ratio > threshold else ""
+        print(
+            f"{name:40} {previous['time']:10.6f} {result['time']:10.6f} "
+            f"{ratio:6.2f}x {flag}",
+            file=sys.stderr,
+        )
+        if ratio > threshold:
+            regressions.append(name)
+    return regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--output", help="write JSON results to this file")
+    parser.add_argument("--compare", help="baseline JSON file to compare against")
+    parser.add_argument("--threshold", type=float, default=1.25)
+    parser.add_argument("--seed", type=int, default=1234)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--quick", action="store_true", help="smaller inputs only")
+    parser.add_argument("--filter", default="", help="only names containing this")
+    args = parser.parse_args()
+
+    results: Dict[str, Dict] = {}
+    for name, setup in benchmarks(quick=args.quick):
+        if args.filter in name:
+            results[name] = run_benchmark(setup, args.seed, args.repeat)
+            print(f"{name:40} {results[name]['time']:.6f}s", file=sys.stderr)
+    report: Dict[str, Any] = {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "seed": args.seed,
+            "repeat": args.repeat,
+        },
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    else:
+        print(json.dumps(report, indent=2))
+    if args.compare:
+        with open(args.compare) as f:
+            baseline: Dict[str, Dict] = json.load(f)["results"]
+        if compare(results, baseline, args.threshold):
+            sys.exit(1)
@@ -0,0 +1,134 @@
+from typing import Dict, Generic, List, Sequence, Tuple, TypeVar
+
+from edge import Edge, WeightedEdge
+
+
+V = TypeVar("V")
+
+
+class CSRGraph(Generic[V]):
+    """Immutable compressed sparse row view of a Graph
+
+    The neighbors of vertex ``i`` are ``neighbors[offsets[i]:offsets[i + 1]]``.
+    Buffers may be ``array.array`` objects or memoryviews over any int buffer.
+    """
+
+    def __init__(
+        self, vertices: Sequence[V], offsets: Sequence[int], neighbors: Sequence[int]
+    ) -> None:
+        if len(offsets) != len(vertices) + 1:
+            raise ValueError("offsets must have one more entry than vertices")
+        self._vertices: Tuple[V, ...] = tuple(vertices)
+        self._indices: Dict[V, int] = {}
+        for index, vertex in enumerate(self._vertices):
+            self._indices.setdefault(vertex, index)
+        self._offsets: Sequence[int] = offsets
+        self._neighbors: Sequence[int] = neighbors
+
+    @property
+    def vertices(self) -> Tuple[V, ...]:
+        return self._vertices
+
+    @property
+    def offsets(self) -> memoryview:
+        """Read-only view of the offsets buffer"""
+        return memoryview(self._offsets).toreadonly()
+
+    @property
+    def neighbors(self) -> memoryview:
+        """Read-only view of the neighbors buffer"""
+        return memoryview(self._neighbors).toreadonly()
+
+    @property
+    def vertex_count(self) -> int:
+        return len(self._vertices)
+
+    @property
+    def edge_count(self) -> int:
+        return len(self._neighbors)
+
+    @property
+    def version(self) -> int:
+        """Always 0; a frozen graph never changes"""
+        return 0
+
+    def freeze(self) -> "CSRGraph[V]":
+        return self
+
+    def vertex_at(self, index: int) -> V:
+        return self._vertices[index]
+
+    def index_of(self, vertex: V) -> int:
+        try:
+            return self._indices[vertex]
+        except KeyError:
+            raise ValueError(f"{vertex!r} is not in graph") from None
+
+    def neighbor_indices(self, index: int) -> Sequence[int]:
+        """Neighbor indices of a vertex, without creating Edge objects"""
+        return self._neighbors[self._offsets[index] : self._offsets[index + 1]]
+
+    def neighbors_for_index(self, index: int) -> List[V]:
+        vertices: Tuple[V, ...] = self._vertices
+        return [vertices[v] for v in self.neighbor_indices(index)]
+
+    def neighbors_for_vertex(self, vertex: V) -> List[V]:
+        return self.neighbors_for_index(self.index_of(vertex))
+
+    def edges_for_index(self, index: int) -> List[Edge]:
+        return [Edge(index, v) for v in self.neighbor_indices(index)]
+
+    def edges_for_vertex(self, vertex: V) -> List[Edge]:
+        return self.edges_for_index(self.index_of(vertex))
+
+    def __str__(self) -> str:
+        desc: str = ""
+        for i in range(self.vertex_count):
+            desc += f"{self.vertex_at(i)} -> {self.neighbors_for_index(i)}\n"
+        return desc
+
+
+class WeightedCSRGraph(CSRGraph[V]):
+    """CSRGraph with a weights buffer parallel to the neighbors buffer"""
+
+    def __init__(
+        self,
+        vertices: Sequence[V],
+        offsets: Sequence[int],
+        neighbors: Sequence[int],
+        weights: Sequence[float],
+    ) -> None:
+        super().__init__(vertices, offsets, neighbors)
+        if len(weights) != len(neighbors):
+            raise ValueError("weights must have one entry per neighbor")
+        self._weights: Sequence[float] = weights
+
+    @property
+    def weights(self) -> memoryview:
+        """Read-only view of the weights buffer, parallel to neighbors"""
+        return memoryview(self._weights).toreadonly()
+
+    def neighbor_weights(self, index: int) -> Sequence[float]:
+        """Edge weights parallel to ``neighbor_indices(index)``"""
+        return self._weights[self._offsets[index] : self._offsets[index + 1]]
+
+    def edges_for_index(self, index: int) -> List[WeightedEdge]:
+        return [
+            WeightedEdge(index, v, w)
+            for v, w in zip(self.neighbor_indices(index), self.neighbor_weights(index))
+        ]
+
+    def neighbors_for_index_with_weights(self, index: int) -> List[Tuple[V, float]]:
+        vertices: Tuple[V, ...] = self._vertices
+        return [
+            (vertices[v], w)
+            for v, w in zip(self.neighbor_indices(index), self.neighbor_weights(index))
+        ]
+
+    def __str__(self) -> str:
+        desc: str = ""
+        for i in range(self.vertex_count):
+            desc += (
+                f"{self.vertex_at(i)} -> {self.neighbors_for_index_with_weights(i)}\n"
+            )
+        return desc
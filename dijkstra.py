@@ -0,0 +1,141 @@
+from typing import Callable, Iterable, List, Optional, Tuple
+
+from edge import WeightedEdge
+from generic_search import IndexedPriorityQueue
+from weighted_graph import WeightedGraph
+
+
+Distances = List[Optional[float]]
+Predecessors = List[Optional[int]]
+EdgeCost = Callable[[WeightedEdge], float]
+
+
+def _weighted_neighbors(
+    wg: WeightedGraph, index: int, cost: Optional[EdgeCost]
+) -> Iterable[Tuple[int, float]]:
+    if cost is None:
+        return zip(wg.neighbor_indices(index), wg.neighbor_weights(index))
+    return [(e.v, cost(e)) for e in wg.edges_for_index(index)]
+
+
+def dijkstra(
+    wg: WeightedGraph,
+    root: int,
+    goal: Optional[int] = None,
+    cost: Optional[EdgeCost] = None,
+) -> Tuple[Distances, Predecessors]:
+    """Single-source shortest paths over vertex indices
+
+    Edge costs are ``WeightedEdge.weight`` unless ``cost`` is given, and must
+    be non-negative. If ``goal`` is given the search stops once it is settled,
+    and only distances along its shortest path are guaranteed final.
+    """
+    distances: Distances = [None] * wg.vertex_count
+    predecessors: Predecessors = [None] * wg.vertex_count
+    distances[root] = 0.0
+    frontier: IndexedPriorityQueue = IndexedPriorityQueue()
+    frontier.push(root, 0.0)
+
+    while not frontier.is_empty:
+        u, dist = frontier.pop_with_priority()
+        if u == goal:
+            break
+        for v, weight in _weighted_neighbors(wg, u, cost):
+            new_dist: float = dist + weight
+            old_dist: Optional[float] = distances[v]
+            if old_dist is None or new_dist < old_dist:
+                distances[v] = new_dist
+                predecessors[v] = u
+                frontier.push_or_decrease(v, new_dist)
+    return distances, predecessors
+
+
+def graph_astar(
+    wg: WeightedGraph,
+    start: int,
+    goal: int,
+    heuristic: Callable[[int], float],
+    cost: Optional[EdgeCost] = None,
+) -> Tuple[Optional[float], List[int]]:
+    """Weighted A* over vertex indices, returning (distance, index path)
+
+    ``heuristic`` must not overestimate the remaining cost for the path to be
+    optimal. The path is empty and the distance None if goal is unreachable.
+    """
+    distances: Distances = [None] * wg.vertex_count
+    predecessors: Predecessors = [None] * wg.vertex_count
+    distances[start] = 0.0
+    frontier: IndexedPriorityQueue = IndexedPriorityQueue()
+    frontier.push(start, heuristic(start))
+
+    while not frontier.is_empty:
+        u = frontier.pop()
+        dist: float = distances[u]
+        if u == goal:
+            return dist, path_to(predecessors, goal)
+        for v, weight in _weighted_neighbors(wg, u, cost):
+            new_dist: float = dist + weight
+            old_dist: Optional[float] = distances[v]
+            if old_dist is None or new_dist < old_dist:
+                distances[v] = new_dist
+                predecessors[v] = u
+                frontier.push_or_decrease(v, new_dist + heuristic(v))
+    return None, []
+
+
+def path_to(predecessors: Predecessors, goal: int) -> List[int]:
+    """Walk a predecessor array back from goal to the root"""
+    path: List[int] = [goal]
+    parent: Optional[int] = predecessors[goal]
+    while parent is not None:
+        path.append(parent)
+        parent = predecessors[parent]
+    path.reverse()
+    return path
+
+
+if __name__ == "__main__":
+    city_graph2: WeightedGraph[str] = WeightedGraph.from_edges(
+        [
+            ("Seattle", "Chicago", 1737),
+            ("Seattle", "San Francisco", 678),
+            ("San Francisco", "Riverside", 386),
+            ("San Francisco", "Los Angeles", 348),
+            ("Los Angeles", "Riverside", 50),
+            ("Los Angeles", "Phoenix", 357),
+            ("Riverside", "Phoenix", 307),
+            ("Riverside", "Chicago", 1704),
+            ("Phoenix", "Dallas", 887),
+            ("Phoenix", "Houston", 1015),
+            ("Dallas", "Chicago", 805),
+            ("Dallas", "Atlanta", 721),
+            ("Dallas", "Houston", 225),
+            ("Houston", "Atlanta", 702),
+            ("Houston", "Miami", 968),
+            ("Atlanta", "Chicago", 588),
+            ("Atlanta", "Washington", 543),
+            ("Atlanta", "Miami", 604),
+            ("Miami", "Washington", 923),
+            ("Chicago", "Detroit", 238),
+            ("Detroit", "Boston", 613),
+            ("Detroit", "Washington", 396),
+            ("Detroit", "New York", 482),
+            ("Boston", "New York", 190),
+            ("New York", "Philadelphia", 81),
+            ("Philadelphia", "Washington", 123),
+        ]
+    )
+
+    root: int = city_graph2.index_of("Los Angeles")
+    distances, predecessors = dijkstra(city_graph2, root)
+    print("Distances from Los Angeles:")
+    for index, distance in enumerate(distances):
+        print(f"{city_graph2.vertex_at(index)} : {distance}")
+
+    goal: int = city_graph2.index_of("Boston")
+    print("Shortest path from Los Angeles to Boston:")
+    print([city_graph2.vertex_at(i) for i in path_to(predecessors, goal)])
+
+    distance, path = graph_astar(city_graph2, root, goal, heuristic=lambda _: 0.0)
+    print(f"A* distance: {distance}")
+    print([city_graph2.vertex_at(i) for i in path])
@@ -0,0 +1,50 @@
+from typing import List
+
+
+class DisjointSet:
+    """Union-find over the integers 0..size-1
+
+    Uses union by rank and path halving, so a sequence of operations runs in
+    near-constant amortized time per operation.
+    """
+
+    def __init__(self, size: int = 0) -> None:
+        self._parent: List[int] = list(range(size))
+        self._rank: bytearray = bytearray(size)
+        self.set_count: int = size
+
+    def __len__(self) -> int:
+        return len(self._parent)
+
+    def add(self) -> int:
+        """Add a new singleton set and return its element"""
+        element: int = len(self._parent)
+        self._parent.append(element)
+        self._rank.append(0)
+        self.set_count += 1
+        return element
+
+    def find(self, x: int) -> int:
+        parent: List[int] = self._parent
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    def union(self, a: int, b: int) -> bool:
+        """Merge the sets holding a and b; False if they were already one set"""
+        root_a: int = self.find(a)
+        root_b: int = self.find(b)
+        if root_a == root_b:
+            return False
+        rank: bytearray = self._rank
+        if rank[root_a] < rank[root_b]:
+            root_a, root_b = root_b, root_a
+        self._parent[root_b] = root_a
+        if rank[root_a] == rank[root_b]:
+            rank[root_a] += 1
+        self.set_count -= 1
+        return True
+
+    def connected(self, a: int, b: int) -> bool:
+        return self.find(a) == self.find(b)
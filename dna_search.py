@@ -1,5 +1,6 @@
+from array import array
 from enum import IntEnum
-from typing import List, Tuple
+from typing import Iterable, List, Sequence, Tuple, Union
 
 Nucleotide: IntEnum = IntEnum("Nucleotide", ("A", "C", "G", "T"))
 Codon = Tuple[Nucleotide, Nucleotide, Nucleotide]
@@ -54,12 +55,125 @@ def binary_contains(sorted_gene: Gene, key_codon: Codon) -> bool:
         if sorted_gene[mid] < key_codon:
             low = mid + 1
         elif sorted_gene[mid] > key_codon:
-            high = mid - 1
+            high = mid
         else:
             return True
     return False
 
 
+# bytes.translate table mapping A, C, G, T to 0-3 and anything else to 0xFF
+_PACK_TABLE: bytes = bytes(
+    "ACGT".find(chr(b)) if chr(b) in "ACGT" else 0xFF for b in range(256)
+)
+
+
+def pack_codons(s: str) -> bytes:
+    """
+    Pack each complete codon of s into one byte holding a 6-bit code
+
+    >>> list(pack_codons("AAAACGTTTG"))
+    [0, 6, 63]
+    >>> pack_codons("ACGTNA")
+    Traceback (most recent call last):
+    ...
+    ValueError: Invalid nucleotide 'N' at position 4
+    """
+    # "replace" keeps one byte per character, so positions still line up
+    codes: bytes = s.encode("ascii", "replace").translate(_PACK_TABLE)
+    position: int = codes.find(0xFF)
+    if position >= 0:
+        raise ValueError(f"Invalid nucleotide {s[position]!r} at position {position}")
+    length: int = len(codes) // 3
+    first: int = int.from_bytes(codes[0 : length * 3 : 3], "big")
+    second: int = int.from_bytes(codes[1 : length * 3 : 3], "big")
+    third: int = int.from_bytes(codes[2 : length * 3 : 3], "big")
+    # Each byte is at most 3, so the shifts never carry into a neighbor
+    return ((first << 4) | (second << 2) | third).to_bytes(length, "big")
+
+
+CodonQuery = Union[str, Codon, int]
+
+
+class CodonIndex:
+    """
+    Codons of a gene string packed into 6-bit codes, with presence and
+    position lookups. Positions are codon indices, as in str_to_gene.
+
+    >>> index = CodonIndex(gene_str)
+    >>> index.contains(["ACG", "CGC", str_to_codon("TTT")])
+    [True, False, True]
+    >>> index.contains("ACGCGC")
+    [True, False]
+    >>> index.count("ACGTTT")
+    [2, 1]
+    >>> [list(p) for p in index.positions(["ACG", "CGC"])]
+    [[0, 7], []]
+    >>> "GGG" in index
+    True
+    >>> index.count([64])
+    Traceback (most recent call last):
+    ...
+    ValueError: Codon code 64 is not between 0 and 63
+    """
+
+    def __init__(self, s: str) -> None:
+        self.codons: bytes = pack_codons(s)
+        self.bitmap: int = 0
+        # 256 entries so it doubles as a bytes.translate table
+        self._present: bytearray = bytearray(256)
+        for code in set(self.codons):
+            self.bitmap |= 1 << code
+            self._present[code] = 1
+        # Codon indices sorted by code (stable, so ascending within a code);
+        # positions of code c are _order[_offsets[c] : _offsets[c + 1]]
+        self._order: array = array(
+            "q", sorted(range(len(self.codons)), key=self.codons.__getitem__)
+        )
+        self._offsets: array = array("q", [0])
+        for code in range(64):
+            self._offsets.append(self._offsets[-1] + self.codons.count(code))
+
+    def __len__(self) -> int:
+        return len(self.codons)
+
+    def __contains__(self, codon: CodonQuery) -> bool:
+        return bool(self.bitmap >> _codon_code(codon) & 1)
+
+    def contains(self, codons: Union[str, Iterable[CodonQuery]]) -> List[bool]:
+        present: bytes = _query_codes(codons).translate(self._present)
+        return [flag == 1 for flag in present]
+
+    def count(self, codons: Union[str, Iterable[CodonQuery]]) -> List[int]:
+        offsets: array = self._offsets
+        return [offsets[c + 1] - offsets[c] for c in _query_codes(codons)]
+
+    def positions(
+        self, codons: Union[str, Iterable[CodonQuery]]
+    ) -> List[Sequence[int]]:
+        offsets: array = self._offsets
+        return [self._order[offsets[c] : offsets[c + 1]] for c in _query_codes(codons)]
+
+
+def _codon_code(codon: CodonQuery) -> int:
+    if isinstance(codon, int):
+        if not 0 <= codon < 64:
+            raise ValueError(f"Codon code {codon} is not between 0 and 63")
+        return codon
+    if isinstance(codon, str):
+        if len(codon) != 3:
+            raise ValueError(f"Input for codon '{codon}' must be of length 3")
+        return pack_codons(codon)[0]
+    first, second, third = codon
+    return (first - 1) << 4 | (second - 1) << 2 | (third - 1)
+
+
+def _query_codes(codons: Union[str, Iterable[CodonQuery]]) -> bytes:
+    """Pack a string of concatenated codons, or an iterable of codons"""
+    if isinstance(codons, str):
+        return pack_codons(codons)
+    return bytes(_codon_code(codon) for codon in codons)
+
+
 if __name__ == "__main__":
     import doctest
 
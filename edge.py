@@ -1,8 +1,20 @@
+from array import array
 from dataclasses import dataclass
+from typing import Optional
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Edge:
+    """An edge from vertex index u to v; immutable, so safe to share
+
+    >>> import copy, pickle
+    >>> edge = WeightedEdge(1, 2, 3.0)
+    >>> pickle.loads(pickle.dumps(edge)) == copy.copy(edge) == copy.deepcopy(edge)
+    True
+    >>> pickle.loads(pickle.dumps(Edge(1, 2)))
+    Edge(u=1, v=2)
+    """
+
     u: int
     v: int
 
@@ -13,7 +25,7 @@ class Edge:
         return f"{self.u} -> {self.v}"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class WeightedEdge(Edge):
     weight: float
 
@@ -25,3 +37,40 @@ class WeightedEdge(Edge):
 
     def __str__(self) -> str:
         return f"{self.u} {self.weight}> {self.v}"
+
+
+class EdgeStore:
+    """Growable edge list kept as parallel typed arrays
+
+    Edge i runs from ``us[i]`` to ``vs[i]`` with weight ``weights[i]``, taking
+    24 bytes rather than a Python object per edge; ``weights`` is None for an
+    unweighted store. Edge objects are only built when ``edge(i)`` is called.
+    """
+
+    def __init__(self, weighted: bool = False) -> None:
+        self.us: array = array("q")
+        self.vs: array = array("q")
+        self.weights: Optional[array] = array("d") if weighted else None
+
+    def __len__(self) -> int:
+        return len(self.us)
+
+    @property
+    def nbytes(self) -> int:
+        size: int = (len(self.us) + len(self.vs)) * self.us.itemsize
+        if self.weights is not None:
+            size += len(self.weights) * self.weights.itemsize
+        return size
+
+    def append(self, u: int, v: int, weight: float = 1.0) -> int:
+        """Add an edge and return its id; weight is ignored if unweighted"""
+        self.us.append(u)
+        self.vs.append(v)
+        if self.weights is not None:
+            self.weights.append(weight)
+        return len(self.us) - 1
+
+    def edge(self, i: int) -> Edge:
+        if self.weights is None:
+            return Edge(self.us[i], self.vs[i])
+        return WeightedEdge(self.us[i], self.vs[i], self.weights[i])
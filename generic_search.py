@@ -1,6 +1,20 @@
 from collections import deque
 from heapq import heappush, heappop
-from typing import Any, Callable, Deque, Dict, Generic, List, Optional, Union
+from time import perf_counter
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Generator,
+    Generic,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
 
 
 class Staque:
@@ -11,6 +25,9 @@ class Staque:
     def is_empty(self) -> bool:
         return len(self._container) == 0
 
+    def __len__(self) -> int:
+        return len(self._container)
+
     def __repr__(self) -> str:
         return repr(self._container)
 
@@ -48,7 +65,114 @@ class PriorityQueue(Staque):
         return heappop(self._container)
 
 
+class IndexedPriorityQueue(Staque):
+    """Binary heap holding each item at most once, with decrease_key
+
+    Entries are ``[priority, item]`` lists and only priorities are compared,
+    so items need to be hashable but not orderable.
+    """
+
+    def __init__(self) -> None:
+        self._container: List[List] = []
+        self._positions: Dict = {}
+
+    def __contains__(self, item: Any) -> bool:
+        return item in self._positions
+
+    def __iter__(self) -> Iterator:
+        """Queued items, in no particular order"""
+        return iter(self._positions)
+
+    def contains(self, item: Any) -> bool:
+        return item in self._positions
+
+    def priority_of(self, item: Any) -> Any:
+        return self._container[self._positions[item]][0]
+
+    def push(self, item: Any, priority: Any) -> None:
+        if item in self._positions:
+            raise ValueError(f"{item!r} is already queued")
+        self._container.append([priority, item])
+        self._sift_up(len(self._container) - 1)
+
+    def decrease_key(self, item: Any, priority: Any) -> None:
+        position: int = self._positions[item]
+        entry: List = self._container[position]
+        if priority > entry[0]:
+            raise ValueError(f"{priority!r} is larger than {entry[0]!r}")
+        entry[0] = priority
+        self._sift_up(position)
+
+    def push_or_decrease(self, item: Any, priority: Any) -> bool:
+        """Queue item, or lower its priority; False if neither happened"""
+        position: Optional[int] = self._positions.get(item)
+        if position is None:
+            self.push(item, priority)
+            return True
+        if priority < self._container[position][0]:
+            self.decrease_key(item, priority)
+            return True
+        return False
+
+    def pop(self) -> Any:
+        return self.pop_with_priority()[0]
+
+    def peek_with_priority(self) -> Tuple[Any, Any]:
+        priority, item = self._container[0]
+        return item, priority
+
+    def pop_with_priority(self) -> Tuple[Any, Any]:
+        container: List[List] = self._container
+        top: List = container.pop()
+        if container:
+            top, container[0] = container[0], top
+            self._sift_down(0)
+        del self._positions[top[1]]
+        return top[1], top[0]
+
+    def _sift_up(self, position: int) -> None:
+        container: List[List] = self._container
+        positions: Dict = self._positions
+        entry: List = container[position]
+        while position > 0:
+            parent_position: int = (position - 1) >> 1
+            parent: List = container[parent_position]
+            if not entry[0] < parent[0]:
+                break
+            container[position] = parent
+            positions[parent[1]] = position
+            position = parent_position
+        container[position] = entry
+        positions[entry[1]] = position
+
+    def _sift_down(self, position: int) -> None:
+        container: List[List] = self._container
+        positions: Dict = self._positions
+        size: int = len(container)
+        entry: List = container[position]
+        while True:
+            child_position: int = 2 * position + 1
+            if child_position >= size:
+                break
+            right_position: int = child_position + 1
+            if (
+                right_position < size
+                and container[right_position][0] < container[child_position][0]
+            ):
+                child_position = right_position
+            child: List = container[child_position]
+            if not child[0] < entry[0]:
+                break
+            container[position] = child
+            positions[child[1]] = position
+            position = child_position
+        container[position] = entry
+        positions[entry[1]] = position
+
+
 class Node:
+    __slots__ = ("state", "parent", "cost", "heuristic")
+
     def __init__(
         self,
         state: Any,
@@ -68,66 +192,774 @@ class Node:
         return (self.cost + self.heuristic) < (other.cost + other.heuristic)
 
 
-def dfs(initial: Any, goal_test: Callable, successors: Callable) -> Optional[Node]:
-    return xfs(initial, goal_test, successors, breadth_first=False)
+class SearchStats:
+    """Counters filled in by a search that is passed ``stats=SearchStats()``
+
+    peak_explored and duplicate_pushes are read off the search's own
+    explored set when it finishes. Callback times are only recorded if timed.
+    """
+
+    def __init__(self, timed: bool = False) -> None:
+        self.timed: bool = timed
+        self.expansions: int = 0
+        self.pushes: int = 0
+        self.duplicate_pushes: int = 0
+        self.peak_frontier: int = 0
+        self.peak_explored: int = 0
+        self.successors_time: float = 0.0
+        self.heuristic_time: float = 0.0
+
+    def __repr__(self) -> str:
+        fields: str = ", ".join(
+            f"{name}={value!r}" for name, value in vars(self).items()
+        )
+        return f"SearchStats({fields})"
+
+
+class _InstrumentedFrontier(Staque):
+    """Frontier proxy that records pushes into a SearchStats"""
+
+    def __init__(
+        self, frontier: Staque, stats: SearchStats, on_push: Optional[Callable]
+    ) -> None:
+        self._frontier: Staque = frontier
+        self._stats: SearchStats = stats
+        self._on_push: Optional[Callable] = on_push
+
+    @property
+    def is_empty(self) -> bool:
+        return self._frontier.is_empty
+
+    def __len__(self) -> int:
+        return len(self._frontier)
+
+    def __repr__(self) -> str:
+        return repr(self._frontier)
+
+    def push(self, item: Any, *priority: Any) -> None:
+        self._frontier.push(item, *priority)
+        self._record(item)
+
+    def push_or_decrease(self, item: Any, priority: Any) -> bool:
+        queued: bool = item in self._frontier
+        changed: bool = self._frontier.push_or_decrease(item, priority)
+        if not queued:
+            self._record(item)
+        return changed
+
+    def pop(self) -> Any:
+        return self._frontier.pop()
+
+    def _record(self, item: Any) -> None:
+        state: Any = item.state if isinstance(item, Node) else item
+        stats: SearchStats = self._stats
+        stats.pushes += 1
+        stats.peak_frontier = max(stats.peak_frontier, len(self._frontier))
+        if self._on_push is not None:
+            self._on_push(state)
+
+
+def _record_explored(stats: Optional[SearchStats], explored: Any) -> None:
+    """Fill in the SearchStats fields that the explored container answers"""
+    if stats is not None:
+        stats.peak_explored = len(explored)
+        stats.duplicate_pushes = stats.pushes - len(explored)
+
+
+def _instrument_successors(
+    successors: Callable, stats: SearchStats, on_expand: Optional[Callable]
+) -> Callable:
+    def instrumented(state: Any) -> Any:
+        stats.expansions += 1
+        if on_expand is not None:
+            on_expand(state)
+        if not stats.timed:
+            return successors(state)
+        start: float = perf_counter()
+        children: Any = successors(state)
+        stats.successors_time += perf_counter() - start
+        return children
+
+    return instrumented
+
+
+def _instrument_heuristic(heuristic: Callable, stats: SearchStats) -> Callable:
+    if not stats.timed:
+        return heuristic
+
+    def instrumented(state: Any) -> float:
+        start: float = perf_counter()
+        estimate: float = heuristic(state)
+        stats.heuristic_time += perf_counter() - start
+        return estimate
+
+    return instrumented
+
+
+class SearchProgress(NamedTuple):
+    """Snapshot yielded by the iter_* searches between chunks of work"""
+
+    expansions: int
+    frontier_size: int
+    explored_size: int
+
+
+SearchSteps = Generator[SearchProgress, None, Optional[Node]]
 
 
-def bfs(initial: Any, goal_test: Callable, successors: Callable) -> Optional[Node]:
-    return xfs(initial, goal_test, successors, breadth_first=True)
+def dfs(
+    initial: Any,
+    goal_test: Callable,
+    successors: Callable,
+    low_memory: bool = False,
+    stats: Optional[SearchStats] = None,
+    on_expand: Optional[Callable] = None,
+    on_push: Optional[Callable] = None,
+) -> Optional[Node]:
+    return xfs(
+        initial,
+        goal_test,
+        successors,
+        breadth_first=False,
+        low_memory=low_memory,
+        stats=stats,
+        on_expand=on_expand,
+        on_push=on_push,
+    )
+
+
+def bfs(
+    initial: Any,
+    goal_test: Callable,
+    successors: Callable,
+    low_memory: bool = False,
+    stats: Optional[SearchStats] = None,
+    on_expand: Optional[Callable] = None,
+    on_push: Optional[Callable] = None,
+) -> Optional[Node]:
+    return xfs(
+        initial,
+        goal_test,
+        successors,
+        breadth_first=True,
+        low_memory=low_memory,
+        stats=stats,
+        on_expand=on_expand,
+        on_push=on_push,
+    )
 
 
 def xfs(
-    initial: Any, goal_test: Callable, successors: Callable, breadth_first: bool = True
+    initial: Any,
+    goal_test: Callable,
+    successors: Callable,
+    breadth_first: bool = True,
+    low_memory: bool = False,
+    stats: Optional[SearchStats] = None,
+    on_expand: Optional[Callable] = None,
+    on_push: Optional[Callable] = None,
 ) -> Optional[Node]:
+    """Breadth- or depth-first search from initial until goal_test passes
+
+    Passing stats, on_expand(state) or on_push(state) instruments the search
+    through wrappers; without them the loop runs untouched.
+    """
     if breadth_first:
         frontier: Staque = Queue()
     else:
         frontier: Staque = Stack()
+    if stats is not None or on_expand is not None or on_push is not None:
+        stats = stats if stats is not None else SearchStats()
+        successors = _instrument_successors(successors, stats, on_expand)
+        frontier = _InstrumentedFrontier(frontier, stats, on_push)
+    if low_memory:
+        return run_search(
+            _xfs_steps(initial, goal_test, successors, frontier, stats=stats)
+        )
     frontier.push(Node(state=initial, parent=None))
-    explored: set = set(initial)
-
-    while not frontier.is_empty:
-        current_node: Node = frontier.pop()
-        current_state = current_node.state
-        if goal_test(current_state):
-            return current_node
-        for child in successors(current_state):
-            if child in explored:
-                continue
-            explored.add(child)
-            frontier.push(Node(state=child, parent=current_node))
-    return None
+    explored: set = {initial}
+
+    try:
+        while not frontier.is_empty:
+            current_node: Node = frontier.pop()
+            current_state = current_node.state
+            if goal_test(current_state):
+                return current_node
+            for child in successors(current_state):
+                if child in explored:
+                    continue
+                explored.add(child)
+                frontier.push(Node(state=child, parent=current_node))
+        return None
+    finally:
+        _record_explored(stats, explored)
+
+
+def _xfs_steps(
+    initial: Any,
+    goal_test: Callable,
+    successors: Callable,
+    frontier: Staque,
+    chunk: int = 0,
+    stats: Optional[SearchStats] = None,
+) -> SearchSteps:
+    """xfs that keeps a state -> parent map and builds Nodes only for the path
+
+    Yields a SearchProgress every chunk expansions, or never if chunk is 0.
+    """
+    frontier.push(initial)
+    parents: Dict = {initial: None}
+    expansions: int = 0
+
+    try:
+        while not frontier.is_empty:
+            current_state = frontier.pop()
+            if goal_test(current_state):
+                return _path_to_node(_parents_to_path(parents, current_state))
+            for child in successors(current_state):
+                if child in parents:
+                    continue
+                parents[child] = current_state
+                frontier.push(child)
+            expansions += 1
+            if chunk and expansions % chunk == 0:
+                yield SearchProgress(expansions, len(frontier), len(parents))
+        return None
+    finally:
+        _record_explored(stats, parents)
 
 
 def astar(
-    initial, goal_test: Callable, successors: Callable, heuristic: Callable
+    initial,
+    goal_test: Callable,
+    successors: Callable,
+    heuristic: Callable,
+    low_memory: bool = False,
+    stats: Optional[SearchStats] = None,
+    on_expand: Optional[Callable] = None,
+    on_push: Optional[Callable] = None,
 ) -> Optional[Node]:
-    frontier: Staque = PriorityQueue()
-    frontier.push(
-        Node(state=initial, parent=None, cost=0.0, heuristic=heuristic(initial))
-    )
-    explored: Dict = {initial: 0.0}
-
-    while not frontier.is_empty:
-        current_node: Node = frontier.pop()
-        current_state = current_node.state
-        if goal_test(current_state):
-            return current_node
-        for child in successors(current_state):
-            new_cost: float = current_node.cost + 1  # assume cost of 1
-            if child not in explored or new_cost < explored[child]:
-                explored[child] = new_cost
-                frontier.push(
-                    Node(
+    """A* with unit step costs; instrumented like xfs
+
+    States are queued at most once in an IndexedPriorityQueue with priority
+    (f, tiebreak); a better path lowers the priority in place. By default a
+    Node is kept per reached state; low_memory keeps only a parent map.
+    """
+    frontier: Staque = IndexedPriorityQueue()
+    if stats is not None or on_expand is not None or on_push is not None:
+        stats = stats if stats is not None else SearchStats()
+        successors = _instrument_successors(successors, stats, on_expand)
+        heuristic = _instrument_heuristic(heuristic, stats)
+        frontier = _InstrumentedFrontier(frontier, stats, on_push)
+    if low_memory:
+        return run_search(
+            _astar_steps(
+                initial, goal_test, successors, heuristic, frontier, stats=stats
+            )
+        )
+    estimate: float = heuristic(initial)
+    frontier.push(initial, (estimate, 0))
+    nodes: Dict = {
+        initial: Node(state=initial, parent=None, cost=0.0, heuristic=estimate)
+    }
+    counter: int = 1
+
+    try:
+        while not frontier.is_empty:
+            current_state = frontier.pop()
+            current_node: Node = nodes[current_state]
+            if goal_test(current_state):
+                return current_node
+            for child in successors(current_state):
+                new_cost: float = current_node.cost + 1  # assume cost of 1
+                previous: Optional[Node] = nodes.get(child)
+                if previous is None or new_cost < previous.cost:
+                    estimate = heuristic(child)
+                    nodes[child] = Node(
                         state=child,
                         parent=current_node,
                         cost=new_cost,
-                        heuristic=heuristic(child),
+                        heuristic=estimate,
+                    )
+                    frontier.push_or_decrease(child, (new_cost + estimate, counter))
+                    counter += 1
+        return None
+    finally:
+        _record_explored(stats, nodes)
+
+
+def _astar_steps(
+    initial,
+    goal_test: Callable,
+    successors: Callable,
+    heuristic: Callable,
+    frontier: IndexedPriorityQueue,
+    chunk: int = 0,
+    stats: Optional[SearchStats] = None,
+) -> SearchSteps:
+    """astar over an indexed frontier of states and a parent map
+
+    Each state is queued at most once, with priority (f, tiebreak); a better
+    path lowers its priority in place instead of pushing a duplicate. Yields
+    like _xfs_steps.
+    """
+    frontier.push(initial, (heuristic(initial), 0))
+    explored: Dict = {initial: 0.0}
+    parents: Dict = {initial: None}
+    counter: int = 1
+    expansions: int = 0
+
+    try:
+        while not frontier.is_empty:
+            current_state = frontier.pop()
+            if goal_test(current_state):
+                return _path_to_node(_parents_to_path(parents, current_state))
+            cost: float = explored[current_state]
+            for child in successors(current_state):
+                new_cost: float = cost + 1  # assume cost of 1
+                if child not in explored or new_cost < explored[child]:
+                    explored[child] = new_cost
+                    parents[child] = current_state
+                    frontier.push_or_decrease(
+                        child, (new_cost + heuristic(child), counter)
                     )
-                )
+                    counter += 1
+            expansions += 1
+            if chunk and expansions % chunk == 0:
+                yield SearchProgress(expansions, len(frontier), len(explored))
+        return None
+    finally:
+        _record_explored(stats, explored)
+
+
+def iddfs(
+    initial: Any,
+    goal_test: Callable,
+    successors: Callable,
+    max_depth: Optional[int] = None,
+    table_size: int = 0,
+) -> Optional[Node]:
+    """Iterative-deepening DFS: a shallowest goal in memory linear in depth
+
+    States already on the current path are skipped. With table_size > 0 a
+    transposition table of at most that many states skips states already
+    reached at the same or a smaller depth in the current iteration.
+    """
+    return _iterative_deepening(
+        initial, goal_test, successors, _zero_heuristic, max_depth, table_size
+    )
+
+
+def idastar(
+    initial: Any,
+    goal_test: Callable,
+    successors: Callable,
+    heuristic: Callable,
+    max_bound: Optional[float] = None,
+    table_size: int = 0,
+) -> Optional[Node]:
+    """IDA* with unit step costs: astar results in memory linear in depth
+
+    Each iteration is a depth-first search cut off where cost + heuristic
+    exceeds the bound, which then grows to the smallest value that was cut.
+    table_size works as in iddfs.
+    """
+    return _iterative_deepening(
+        initial, goal_test, successors, heuristic, max_bound, table_size
+    )
+
+
+def _iterative_deepening(
+    initial: Any,
+    goal_test: Callable,
+    successors: Callable,
+    heuristic: Callable,
+    max_bound: Optional[float],
+    table_size: int,
+) -> Optional[Node]:
+    bound: float = heuristic(initial)
+    while max_bound is None or bound <= max_bound:
+        table: Optional[Dict] = {} if table_size > 0 else None
+        path, next_bound = _bounded_dfs(
+            initial, goal_test, successors, heuristic, bound, table, table_size
+        )
+        if path is not None:
+            return _path_to_node(path)
+        if next_bound == float("inf"):
+            return None  # nothing was cut off, so the space is exhausted
+        bound = next_bound
+    return None
+
+
+_EXHAUSTED = object()
+
+
+def _bounded_dfs(
+    initial: Any,
+    goal_test: Callable,
+    successors: Callable,
+    heuristic: Callable,
+    bound: float,
+    table: Optional[Dict],
+    table_size: int,
+) -> Tuple[Optional[List], float]:
+    """Depth-first search of states with cost + heuristic <= bound
+
+    Returns the path to a goal, or None and the smallest f that was cut off.
+    Keeps only the current path and one successor iterator per level.
+    """
+    next_bound: float = float("inf")
+    if goal_test(initial):
+        return [initial], bound
+    path: List = [initial]
+    on_path: set = {initial}
+    iterators: List = [iter(successors(initial))]
+
+    while iterators:
+        child = next(iterators[-1], _EXHAUSTED)
+        if child is _EXHAUSTED:
+            iterators.pop()
+            on_path.discard(path.pop())
+            continue
+        if child in on_path:
+            continue
+        cost: int = len(path)
+        estimate: float = cost + heuristic(child)
+        if estimate > bound:
+            next_bound = min(next_bound, estimate)
+            continue
+        if table is not None:
+            seen: Optional[int] = table.get(child)
+            if seen is not None and seen <= cost:
+                continue
+            if seen is not None or len(table) < table_size:
+                table[child] = cost
+        path.append(child)
+        if goal_test(child):
+            return path, bound
+        on_path.add(child)
+        iterators.append(iter(successors(child)))
+    return None, next_bound
+
+
+class AnytimeResult(NamedTuple):
+    """Best solution found, with its cost at most bound times the optimum"""
+
+    node: Optional[Node]
+    bound: float
+    complete: bool  # False if a budget ran out before the search finished
+
+
+def weighted_astar(
+    initial: Any,
+    goal_test: Callable,
+    successors: Callable,
+    heuristic: Callable,
+    epsilon: float = 2.0,
+    max_expansions: Optional[int] = None,
+    time_budget: Optional[float] = None,
+) -> AnytimeResult:
+    """astar with the heuristic inflated by epsilon
+
+    Usually expands far fewer states than astar, and the solution costs at
+    most epsilon times the optimum.
+    """
+    return arastar(
+        initial,
+        goal_test,
+        successors,
+        heuristic,
+        epsilon=epsilon,
+        final_epsilon=epsilon,
+        max_expansions=max_expansions,
+        time_budget=time_budget,
+    )
+
+
+def arastar(
+    initial: Any,
+    goal_test: Callable,
+    successors: Callable,
+    heuristic: Callable,
+    epsilon: float = 3.0,
+    epsilon_step: float = 0.5,
+    final_epsilon: float = 1.0,
+    max_expansions: Optional[int] = None,
+    time_budget: Optional[float] = None,
+) -> AnytimeResult:
+    """Anytime Repairing A* (ARA*) with unit step costs
+
+    Runs weighted astar with epsilon, then keeps lowering epsilon by
+    epsilon_step down to final_epsilon, reusing earlier work each time. If
+    max_expansions or time_budget (seconds) runs out, the best solution so
+    far is returned with complete=False. bound is the smaller of the last
+    finished epsilon and best cost / the lowest cost + heuristic still open.
+    """
+    deadline: Optional[float] = (
+        None if time_budget is None else perf_counter() + time_budget
+    )
+    estimates: Dict = {}
+
+    def estimate(state: Any) -> float:
+        if state not in estimates:
+            estimates[state] = heuristic(state)
+        return estimates[state]
+
+    costs: Dict = {initial: 0.0}
+    parents: Dict = {initial: None}
+    frontier: IndexedPriorityQueue = IndexedPriorityQueue()
+    frontier.push(initial, epsilon * estimate(initial))
+    closed: set = set()
+    inconsistent: set = set()
+    best_cost: float = float("inf")
+    best_path: Optional[List] = None
+    bound: float = float("inf")
+    expansions: int = 0
+
+    while True:
+        out_of_budget: bool = False
+        while not frontier.is_empty and best_cost > frontier.peek_with_priority()[1]:
+            if (max_expansions is not None and expansions >= max_expansions) or (
+                deadline is not None and perf_counter() >= deadline
+            ):
+                out_of_budget = True
+                break
+            current_state = frontier.pop()
+            closed.add(current_state)
+            expansions += 1
+            cost: float = costs[current_state]
+            if goal_test(current_state):
+                if cost < best_cost:
+                    best_cost = cost
+                    best_path = _parents_to_path(parents, current_state)
+                continue
+            for child in successors(current_state):
+                new_cost: float = cost + 1  # assume cost of 1
+                if child not in costs or new_cost < costs[child]:
+                    costs[child] = new_cost
+                    parents[child] = current_state
+                    if child in closed:
+                        inconsistent.add(child)
+                    else:
+                        frontier.push_or_decrease(
+                            child, new_cost + epsilon * estimate(child)
+                        )
+
+        lower: float = min(
+            (costs[s] + estimate(s) for s in (*frontier, *inconsistent)),
+            default=float("inf"),
+        )
+        if best_path is not None:
+            if lower == float("inf") or best_cost <= lower:
+                bound = 1.0
+            elif lower > 0:
+                bound = min(bound, best_cost / lower)
+            if not out_of_budget:
+                bound = min(bound, epsilon)
+        node: Optional[Node] = None if best_path is None else _path_to_node(best_path)
+        if out_of_budget:
+            return AnytimeResult(node, bound, False)
+        if epsilon <= final_epsilon or bound <= 1.0 or lower == float("inf"):
+            return AnytimeResult(node, bound, True)
+
+        # Tighten epsilon and requeue everything left open or inconsistent
+        epsilon = max(final_epsilon, epsilon - epsilon_step)
+        requeue: List = [*frontier, *inconsistent]
+        frontier = IndexedPriorityQueue()
+        for state in requeue:
+            frontier.push(state, costs[state] + epsilon * estimate(state))
+        inconsistent = set()
+        closed = set()
+
+
+def iter_xfs(
+    initial: Any,
+    goal_test: Callable,
+    successors: Callable,
+    breadth_first: bool = True,
+    chunk: int = 1000,
+) -> SearchSteps:
+    """Resumable low-memory xfs that yields a SearchProgress every chunk
+    expansions; the goal Node (or None) is the generator's return value
+
+    Drive it with next() or run_search(); close() cancels it.
+    """
+    frontier: Staque = Queue() if breadth_first else Stack()
+    return _xfs_steps(initial, goal_test, successors, frontier, chunk)
+
+
+def iter_bfs(
+    initial: Any, goal_test: Callable, successors: Callable, chunk: int = 1000
+) -> SearchSteps:
+    return iter_xfs(initial, goal_test, successors, breadth_first=True, chunk=chunk)
+
+
+def iter_dfs(
+    initial: Any, goal_test: Callable, successors: Callable, chunk: int = 1000
+) -> SearchSteps:
+    return iter_xfs(initial, goal_test, successors, breadth_first=False, chunk=chunk)
+
+
+def iter_astar(
+    initial: Any,
+    goal_test: Callable,
+    successors: Callable,
+    heuristic: Callable,
+    chunk: int = 1000,
+) -> SearchSteps:
+    """Resumable low-memory astar; yields and returns like iter_xfs"""
+    frontier: IndexedPriorityQueue = IndexedPriorityQueue()
+    return _astar_steps(initial, goal_test, successors, heuristic, frontier, chunk)
+
+
+def run_search(steps: SearchSteps) -> Optional[Node]:
+    """Drive an iter_* search to completion and return its result"""
+    while True:
+        try:
+            next(steps)
+        except StopIteration as done:
+            return done.value
+
+
+def bidirectional_bfs(
+    initial: Any,
+    goal: Any,
+    successors: Callable,
+    predecessors: Optional[Callable] = None,
+) -> Optional[Node]:
+    """Breadth-first search from both ends, meeting in the middle
+
+    ``predecessors`` defaults to ``successors``, which is correct for
+    undirected state spaces such as Graph.
+    """
+    if predecessors is None:
+        predecessors = successors
+    if initial == goal:
+        return Node(state=initial, parent=None)
+    forward: Dict = {initial: None}
+    backward: Dict = {goal: None}
+    forward_level: List = [initial]
+    backward_level: List = [goal]
+
+    while forward_level and backward_level:
+        # Expand whole levels of the smaller side; the first meeting found
+        # while finishing a level is on a shortest path
+        if len(forward_level) <= len(backward_level):
+            level, parents, others, expand = (
+                forward_level,
+                forward,
+                backward,
+                successors,
+            )
+        else:
+            level, parents, others, expand = (
+                backward_level,
+                backward,
+                forward,
+                predecessors,
+            )
+        next_level: List = []
+        for state in level:
+            for child in expand(state):
+                if child in parents:
+                    continue
+                parents[child] = state
+                if child in others:
+                    return _meet_to_node(forward, backward, child)
+                next_level.append(child)
+        if parents is forward:
+            forward_level = next_level
+        else:
+            backward_level = next_level
     return None
 
 
+def bidirectional_astar(
+    initial: Any,
+    goal: Any,
+    successors: Callable,
+    heuristic: Callable,
+    reverse_heuristic: Optional[Callable] = None,
+    predecessors: Optional[Callable] = None,
+) -> Optional[Node]:
+    """A* from both ends with unit step costs, like astar
+
+    ``heuristic`` estimates the distance to goal and ``reverse_heuristic`` the
+    distance back to initial (zero if not given). The search stops once no
+    open state on either side can improve on the best meeting found.
+    """
+    if predecessors is None:
+        predecessors = successors
+    if reverse_heuristic is None:
+        reverse_heuristic = _zero_heuristic
+    sides = (
+        (successors, heuristic, {initial: 0.0}, {initial: None}),
+        (predecessors, reverse_heuristic, {goal: 0.0}, {goal: None}),
+    )
+    frontiers: tuple = (
+        [(heuristic(initial), 0.0, 0, initial)],
+        [(reverse_heuristic(goal), 0.0, 1, goal)],
+    )
+    counter: int = 2
+    best: float = 0.0 if initial == goal else float("inf")
+    meeting: Any = initial if initial == goal else None
+
+    while frontiers[0] and frontiers[1]:
+        if best <= max(frontiers[0][0][0], frontiers[1][0][0]):
+            break
+        side: int = 0 if len(frontiers[0]) <= len(frontiers[1]) else 1
+        expand, estimate, costs, parents = sides[side]
+        other_costs: Dict = sides[1 - side][2]
+        frontier: List = frontiers[side]
+        _, cost, _, state = heappop(frontier)
+        if cost > costs[state]:
+            continue  # stale entry
+        for child in expand(state):
+            new_cost: float = cost + 1  # assume cost of 1
+            if child in costs and new_cost >= costs[child]:
+                continue
+            costs[child] = new_cost
+            parents[child] = state
+            heappush(frontier, (new_cost + estimate(child), new_cost, counter, child))
+            counter += 1
+            if child in other_costs and new_cost + other_costs[child] < best:
+                best = new_cost + other_costs[child]
+                meeting = child
+    if meeting is None:
+        return None
+    return _meet_to_node(sides[0][3], sides[1][3], meeting)
+
+
+def _zero_heuristic(state: Any) -> float:
+    return 0.0
+
+
+def _meet_to_node(forward: Dict, backward: Dict, meeting: Any) -> Node:
+    """Join forward and backward parent maps at the meeting state"""
+    path: List = _parents_to_path(forward, meeting)
+    state: Any = backward[meeting]
+    while state is not None:
+        path.append(state)
+        state = backward[state]
+    return _path_to_node(path)
+
+
+def _parents_to_path(parents: Dict, state: Any) -> List:
+    path: List = []
+    while state is not None:
+        path.append(state)
+        state = parents[state]
+    path.reverse()
+    return path
+
+
+def _path_to_node(path: List) -> Node:
+    node: Optional[Node] = None
+    for cost, state in enumerate(path):
+        node = Node(state=state, parent=node, cost=float(cost))
+    return node
+
+
 def node_to_path(node: Node) -> List:
     if not node:
         return []
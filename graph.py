@@ -1,6 +1,8 @@
-from typing import Generic, List, TypeVar
+from array import array
+from typing import Dict, Generic, Iterable, List, Tuple, TypeVar
 
-from edge import Edge
+from csr_graph import CSRGraph
+from edge import Edge, EdgeStore
 from generic_search import bfs, node_to_path
 
 
@@ -8,9 +10,41 @@ V = TypeVar("V")
 
 
 class Graph(Generic[V]):
+    """Undirected graph with edges kept in an EdgeStore
+
+    Each vertex keeps typed arrays of its neighbor indices and of the ids of
+    the edges reaching them; Edge objects are built only by edges_for_index.
+    """
+
     def __init__(self, vertices: List[V] = []) -> None:
-        self._vertices: List[V] = vertices
-        self._edges: List[List[Edge]] = [[] for _ in vertices]
+        self._vertices: List[V] = list(vertices)
+        self._store: EdgeStore = EdgeStore()
+        self._neighbors: List[array] = [array("q") for _ in self._vertices]
+        self._edge_ids: List[array] = [array("q") for _ in self._vertices]
+        self._indices: Dict[V, int] = {}
+        for index, vertex in enumerate(self._vertices):
+            self._indices.setdefault(vertex, index)
+        self._version: int = 0
+
+    @classmethod
+    def from_edges(
+        cls, edges: Iterable[Tuple[V, V]], vertices: Iterable[V] = ()
+    ) -> "Graph[V]":
+        """Build a graph from (first, second) vertex pairs in a single pass
+
+        Vertices are added in order of first appearance, after ``vertices``.
+        """
+        graph: Graph[V] = cls(vertices)
+        indices: Dict[V, int] = graph._indices
+        for first, second in edges:
+            u = indices.get(first)
+            if u is None:
+                u = graph.add_vertex(first)
+            v = indices.get(second)
+            if v is None:
+                v = graph.add_vertex(second)
+            graph._link(u, v)
+        return graph
 
     @property
     def vertex_count(self) -> int:
@@ -18,45 +52,83 @@ class Graph(Generic[V]):
 
     @property
     def edge_count(self) -> int:
-        return sum(map(len, self._edges))
+        """Adjacency entries: twice the number of undirected edges"""
+        return 2 * len(self._store)
+
+    @property
+    def edge_store(self) -> EdgeStore:
+        """Every undirected edge once, in insertion order; do not modify"""
+        return self._store
+
+    @property
+    def version(self) -> int:
+        """Bumped by every mutation, so caches can detect stale results"""
+        return self._version
 
     def add_vertex(self, vertex: V) -> int:
         """Add vertex and return its index"""
+        index: int = len(self._vertices)
         self._vertices.append(vertex)
-        self._edges.append([])
-        return self.vertex_count - 1
+        self._neighbors.append(array("q"))
+        self._edge_ids.append(array("q"))
+        self._indices.setdefault(vertex, index)
+        self._version += 1
+        return index
+
+    def _link(self, u: int, v: int, weight: float = 1.0) -> None:
+        edge_id: int = self._store.append(u, v, weight)
+        self._neighbors[u].append(v)
+        self._edge_ids[u].append(edge_id)
+        self._neighbors[v].append(u)
+        self._edge_ids[v].append(edge_id)
 
     def add_edge(self, edge: Edge) -> None:
-        self._edges[edge.u].append(edge)
-        self._edges[edge.v].append(edge.reversed())
+        self.add_edge_by_indices(edge.u, edge.v)
 
     def add_edge_by_indices(self, u: int, v: int) -> None:
-        edge = Edge(u, v)
-        self.add_edge(edge)
+        self._link(u, v)
+        self._version += 1
 
     def add_edge_by_vertices(self, first: V, second: V) -> None:
-        u: int = self._vertices.index(first)
-        v: int = self._vertices.index(second)
+        u: int = self.index_of(first)
+        v: int = self.index_of(second)
         self.add_edge_by_indices(u, v)
 
     def vertex_at(self, index: int) -> V:
         return self._vertices[index]
 
     def index_of(self, vertex: V) -> int:
-        return self._vertices.index(vertex)
+        try:
+            return self._indices[vertex]
+        except KeyError:
+            raise ValueError(f"{vertex!r} is not in graph") from None
+
+    def neighbor_indices(self, index: int) -> array:
+        """Neighbor indices of a vertex, without creating Edge objects"""
+        return self._neighbors[index][:]
 
     def neighbors_for_index(self, index: int) -> List[V]:
-        return list(map(self.vertex_at, [e.v for e in self._edges[index]]))
+        vertices: List[V] = self._vertices
+        return [vertices[v] for v in self._neighbors[index]]
 
     def neighbors_for_vertex(self, vertex: V) -> List[V]:
         return self.neighbors_for_index(self.index_of(vertex))
 
     def edges_for_index(self, index: int) -> List[Edge]:
-        return self._edges[index]
+        return [Edge(index, v) for v in self._neighbors[index]]
 
     def edges_for_vertex(self, vertex: V) -> List[Edge]:
         return self.edges_for_index(self.index_of(vertex))
 
+    def freeze(self) -> CSRGraph[V]:
+        """Return an immutable, array-backed snapshot of this graph"""
+        offsets: array = array("q", [0])
+        neighbors: array = array("q")
+        for adjacent in self._neighbors:
+            neighbors.extend(adjacent)
+            offsets.append(len(neighbors))
+        return CSRGraph(self._vertices, offsets, neighbors)
+
     def __str__(self) -> str:
         desc: str = ""
         for i in range(self.vertex_count):
@@ -0,0 +1,128 @@
+"""Compact binary graph files that load by memory-mapping
+
+Layout, all little-endian, each section starting on an 8-byte boundary:
+
+    header    magic "CSPG", format version, flags, vertex count,
+              neighbor entry count, label table size in bytes
+    labels    vertex labels as a UTF-8 JSON array
+    offsets   (vertex count + 1) int64 CSR offsets
+    neighbors (entry count) int64 neighbor indices
+    weights   (entry count) float64, present only for weighted graphs
+
+Labels must survive a JSON round trip unchanged, e.g. str or int.
+"""
+from array import array
+import json
+import mmap
+import os
+import struct
+import sys
+from typing import Callable, List, Sequence, Tuple, Union
+
+from csr_graph import CSRGraph, WeightedCSRGraph
+from graph import Graph
+
+
+_HEADER = struct.Struct("<4sHHQQQ")
+_MAGIC = b"CSPG"
+_VERSION = 1
+_WEIGHTED = 0b1
+
+
+def _padding(size: int) -> bytes:
+    return bytes(-size % 8)
+
+
+def _little_endian(buffer: memoryview, typecode: str) -> Union[bytes, memoryview]:
+    if buffer.format != typecode:
+        buffer = memoryview(array(typecode, buffer))
+    if sys.byteorder == "little":
+        return buffer
+    swapped: array = array(typecode, buffer)
+    swapped.byteswap()
+    return swapped.tobytes()
+
+
+def save_graph(graph: Union[Graph, CSRGraph], path: str) -> None:
+    frozen: CSRGraph = graph.freeze()
+    weighted: bool = isinstance(frozen, WeightedCSRGraph)
+    labels: bytes = json.dumps(frozen.vertices).encode("utf-8")
+    with open(path, "wb") as f:
+        f.write(
+            _HEADER.pack(
+                _MAGIC,
+                _VERSION,
+                _WEIGHTED if weighted else 0,
+                frozen.vertex_count,
+                frozen.edge_count,
+                len(labels),
+            )
+        )
+        f.write(_padding(_HEADER.size))
+        f.write(labels)
+        f.write(_padding(len(labels)))
+        f.write(_little_endian(frozen.offsets, "q"))
+        f.write(_little_endian(frozen.neighbors, "q"))
+        if weighted:
+            f.write(_little_endian(frozen.weights, "d"))
+
+
+class _MappedGraph:
+    """Pickles as its file path, so every process that unpickles a loaded
+    graph, e.g. a spawned pool worker, maps the same shared pages itself
+    """
+
+    _path: str
+
+    def __reduce__(self) -> Tuple[Callable, Tuple[str]]:
+        return load_graph, (self._path,)
+
+
+class _MappedCSRGraph(_MappedGraph, CSRGraph):
+    pass
+
+
+class _MappedWeightedCSRGraph(_MappedGraph, WeightedCSRGraph):
+    pass
+
+
+def _section(mapped: mmap.mmap, start: int, count: int, typecode: str) -> Sequence:
+    view: memoryview = memoryview(mapped)[start : start + count * 8]
+    if sys.byteorder == "little":
+        return view.cast(typecode)
+    copy: array = array(typecode, bytes(view))
+    copy.byteswap()
+    return copy
+
+
+def load_graph(path: str) -> CSRGraph:
+    """Map a file written by save_graph; arrays are not read until used
+
+    Returns a WeightedCSRGraph for weighted graphs. The pages are shared
+    read-only, so many processes can map the same file cheaply; the graph
+    pickles as its path, and unpickling maps the file again.
+    """
+    with open(path, "rb") as f:
+        mapped: mmap.mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    magic, version, flags, vertex_count, entry_count, labels_size = (
+        _HEADER.unpack_from(mapped)
+    )
+    if magic != _MAGIC:
+        raise ValueError(f"{path} is not a graph file")
+    if version != _VERSION:
+        raise ValueError(f"Unsupported graph file version {version}")
+    position: int = _HEADER.size + len(_padding(_HEADER.size))
+    vertices: List = json.loads(mapped[position : position + labels_size])
+    position += labels_size + len(_padding(labels_size))
+    offsets: Sequence[int] = _section(mapped, position, vertex_count + 1, "q")
+    position += (vertex_count + 1) * 8
+    neighbors: Sequence[int] = _section(mapped, position, entry_count, "q")
+    position += entry_count * 8
+    graph: CSRGraph
+    if not flags & _WEIGHTED:
+        graph = _MappedCSRGraph(vertices, offsets, neighbors)
+    else:
+        weights: Sequence[float] = _section(mapped, position, entry_count, "d")
+        graph = _MappedWeightedCSRGraph(vertices, offsets, neighbors, weights)
+    graph._path = os.path.abspath(path)
+    return graph
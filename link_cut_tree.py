@@ -0,0 +1,173 @@
+from typing import List
+
+
+class LinkCutTree:
+    """Forest of rooted trees supporting link, cut and path-maximum queries
+
+    Every operation runs in O(log n) amortized time. Each node carries a
+    value; path_max returns the node with the largest value on the path
+    between two nodes. Nodes are the integers returned by add_node.
+
+    >>> tree = LinkCutTree()
+    >>> a, b, c = (tree.add_node(value) for value in (1.0, 5.0, 3.0))
+    >>> tree.link(a, b)
+    >>> tree.link(b, c)
+    >>> tree.connected(a, c), tree.path_max(a, c) == b
+    (True, True)
+    >>> tree.cut(a, b)
+    >>> tree.connected(a, c), tree.path_max(b, c) == b
+    (False, True)
+    """
+
+    def __init__(self, size: int = 0) -> None:
+        self._left: List[int] = []
+        self._right: List[int] = []
+        self._parent: List[int] = []
+        self._flipped: List[bool] = []
+        self._best: List[int] = []  # largest-value node in each splay subtree
+        self.values: List[float] = []
+        for _ in range(size):
+            self.add_node()
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def add_node(self, value: float = float("-inf")) -> int:
+        node: int = len(self.values)
+        self._left.append(-1)
+        self._right.append(-1)
+        self._parent.append(-1)
+        self._flipped.append(False)
+        self._best.append(node)
+        self.values.append(value)
+        return node
+
+    def set_value(self, node: int, value: float) -> None:
+        """Change the value of a node that is not linked to any other"""
+        self.values[node] = value
+        self._best[node] = node
+
+    def connected(self, x: int, y: int) -> bool:
+        return self.find_root(x) == self.find_root(y)
+
+    def find_root(self, x: int) -> int:
+        self._access(x)
+        self._push(x)
+        while self._left[x] != -1:
+            x = self._left[x]
+            self._push(x)
+        self._splay(x)
+        return x
+
+    def link(self, x: int, y: int) -> None:
+        """Join the trees of x and y with an edge; they must be disconnected"""
+        self._make_root(x)
+        self._parent[x] = y
+
+    def cut(self, x: int, y: int) -> None:
+        """Remove the edge between adjacent nodes x and y"""
+        self._make_root(x)
+        self._access(y)
+        child: int = self._left[y]
+        if child != -1:
+            self._push(child)
+        if child != x or self._right[x] != -1:
+            raise ValueError(f"{x} and {y} are not adjacent")
+        self._parent[child] = -1
+        self._left[y] = -1
+        self._update(y)
+
+    def path_max(self, x: int, y: int) -> int:
+        """Node with the largest value on the path between connected x and y"""
+        self._make_root(x)
+        self._access(y)
+        return self._best[y]
+
+    def _is_root(self, x: int) -> bool:
+        """True if x is the root of its splay tree (not of its real tree)"""
+        parent: int = self._parent[x]
+        return parent == -1 or (self._left[parent] != x and self._right[parent] != x)
+
+    def _push(self, x: int) -> None:
+        if self._flipped[x]:
+            left: int = self._left[x]
+            right: int = self._right[x]
+            self._left[x], self._right[x] = right, left
+            if left != -1:
+                self._flipped[left] = not self._flipped[left]
+            if right != -1:
+                self._flipped[right] = not self._flipped[right]
+            self._flipped[x] = False
+
+    def _update(self, x: int) -> None:
+        values: List[float] = self.values
+        best: int = x
+        for child in (self._left[x], self._right[x]):
+            if child != -1 and values[self._best[child]] > values[best]:
+                best = self._best[child]
+        self._best[x] = best
+
+    def _rotate(self, x: int) -> None:
+        left: List[int] = self._left
+        right: List[int] = self._right
+        parents: List[int] = self._parent
+        parent: int = parents[x]
+        grandparent: int = parents[parent]
+        if not self._is_root(parent):
+            if left[grandparent] == parent:
+                left[grandparent] = x
+            else:
+                right[grandparent] = x
+        parents[x] = grandparent
+        if left[parent] == x:
+            left[parent] = right[x]
+            if right[x] != -1:
+                parents[right[x]] = parent
+            right[x] = parent
+        else:
+            right[parent] = left[x]
+            if left[x] != -1:
+                parents[left[x]] = parent
+            left[x] = parent
+        parents[parent] = x
+        self._update(parent)
+        self._update(x)
+
+    def _splay(self, x: int) -> None:
+        # Pending flips must be pushed from the splay root down to x first
+        path: List[int] = [x]
+        while not self._is_root(path[-1]):
+            path.append(self._parent[path[-1]])
+        for node in reversed(path):
+            self._push(node)
+        while not self._is_root(x):
+            parent: int = self._parent[x]
+            if not self._is_root(parent):
+                grandparent: int = self._parent[parent]
+                zig_zig: bool = (self._left[grandparent] == parent) == (
+                    self._left[parent] == x
+                )
+                self._rotate(parent if zig_zig else x)
+            self._rotate(x)
+
+    def _access(self, x: int) -> None:
+        """Make the root-to-x path preferred, with x at the top of its splay"""
+        last: int = -1
+        y: int = x
+        while y != -1:
+            self._splay(y)
+            self._right[y] = last
+            self._update(y)
+            last = y
+            y = self._parent[y]
+        self._splay(x)
+
+    def _make_root(self, x: int) -> None:
+        self._access(x)
+        self._flipped[x] = not self._flipped[x]
+
+
+if __name__ == "__main__":
+    import doctest
+
+    doctest.testmod(verbose=True)
@@ -1,11 +1,12 @@
+from array import array
 from collections import namedtuple
 from enum import Enum
 from math import sqrt
 import random
 import time
-from typing import Callable, List, NamedTuple, Optional
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple, Union
 
-from generic_search import astar, dfs, bfs, node_to_path
+from generic_search import IndexedPriorityQueue, astar, dfs, bfs, node_to_path
 
 
 class Cell(str, Enum):
@@ -42,6 +43,7 @@ class Maze:
         self._randomly_fill(sparseness)
         self._grid[self.start.row][self.start.col] = Cell.START
         self._grid[self.goal.row][self.goal.col] = Cell.GOAL
+        self._version: int = 0
 
     def _randomly_fill(self, sparseness: float) -> None:
         for r_ind in range(self.num_rows):
@@ -52,6 +54,17 @@ class Maze:
     def __str__(self) -> str:
         return "\n".join(["".join(row) for row in self._grid])
 
+    @property
+    def version(self) -> int:
+        """Bumped whenever a cell is blocked or unblocked"""
+        return self._version
+
+    def set_blocked(self, ml: MazeLocation, blocked: bool = True) -> None:
+        if ml in (self.start, self.goal):
+            raise ValueError("The start and goal cannot be blocked")
+        self._grid[ml.row][ml.col] = Cell.BLOCKED if blocked else Cell.EMPTY
+        self._version += 1
+
     def is_accessible(
         self,
         ml: Optional[MazeLocation] = None,
@@ -83,6 +96,10 @@ class Maze:
         }
         return [poss for poss in possibilities if self.is_accessible(ml=poss)]
 
+    def open_cells(self) -> bytearray:
+        """Row-major flags, 1 for every cell that is not BLOCKED"""
+        return bytearray(cell != Cell.BLOCKED for row in self._grid for cell in row)
+
     def mark(self, path: List[MazeLocation]):
         for ml in path:
             if ml not in (self.start, self.goal):
@@ -95,6 +112,537 @@ class Maze:
                     self._grid[r_ind][c_ind] = Cell.EMPTY
 
 
+_BLOCKED: int = ord(Cell.BLOCKED.value)
+_EMPTY: int = ord(Cell.EMPTY.value)
+_GOAL: int = ord(Cell.GOAL.value)
+_PATH: int = ord(Cell.PATH.value)
+_START: int = ord(Cell.START.value)
+# bytes.translate table turning PATH cells back into EMPTY ones
+_CLEAR_TABLE: bytes = bytes(_EMPTY if b == _PATH else b for b in range(256))
+# bytes.translate table turning cells into open_cells() flags
+_OPEN_TABLE: bytes = bytes(b != _BLOCKED for b in range(256))
+
+
+class CompactMaze:
+    """Maze stored as one row-major bytearray of Cell characters
+
+    Offers the same interface as Maze, plus index-based lookups (index =
+    row * num_columns + col) that avoid building MazeLocations. Random fill
+    draws one byte per cell, so sparseness is applied in steps of 1/256.
+    """
+
+    def __init__(
+        self,
+        num_rows: int = 10,
+        num_columns: int = 10,
+        start: MazeLocation = MazeLocation(0, 0),
+        goal: Optional[MazeLocation] = None,
+        sparseness: float = 0.2,
+        seed: Optional[int] = None,
+    ) -> None:
+        if goal is None:
+            goal = MazeLocation(num_rows - 1, num_columns - 1)
+        self.num_rows: int = num_rows
+        self.num_columns: int = num_columns
+        self.start: MazeLocation = start
+        self.goal: MazeLocation = goal
+        self._cells: bytearray = self._random_cells(sparseness, seed)
+        self._cells[self.index_of(start)] = _START
+        self._cells[self.index_of(goal)] = _GOAL
+        self._version: int = 0
+
+    def _random_cells(self, sparseness: float, seed: Optional[int]) -> bytearray:
+        size: int = self.num_rows * self.num_columns
+        rng = random if seed is None else random.Random(seed)
+        noise: bytes = rng.randbytes(size)
+        threshold: int = round(sparseness * 256)
+        table: bytes = bytes(_BLOCKED if b < threshold else _EMPTY for b in range(256))
+        return bytearray(noise.translate(table))
+
+    def __str__(self) -> str:
+        cells: bytearray = self._cells
+        cols: int = self.num_columns
+        rows: List[str] = [
+            cells[start : start + cols].decode() for start in range(0, len(cells), cols)
+        ]
+        return "\n".join(rows)
+
+    @property
+    def version(self) -> int:
+        """Bumped whenever a cell is blocked or unblocked"""
+        return self._version
+
+    def set_blocked(self, ml: MazeLocation, blocked: bool = True) -> None:
+        if ml in (self.start, self.goal):
+            raise ValueError("The start and goal cannot be blocked")
+        self._cells[self.index_of(ml)] = _BLOCKED if blocked else _EMPTY
+        self._version += 1
+
+    def index_of(self, ml: MazeLocation) -> int:
+        return ml.row * self.num_columns + ml.col
+
+    def location_of(self, index: int) -> MazeLocation:
+        return MazeLocation(*divmod(index, self.num_columns))
+
+    def is_open(self, index: int) -> bool:
+        return self._cells[index] != _BLOCKED
+
+    def is_accessible(
+        self,
+        ml: Optional[MazeLocation] = None,
+        x: Optional[int] = None,
+        y: Optional[int] = None,
+    ) -> bool:
+        assert (ml is not None) or (x and y)
+        if ml is None:
+            ml = MazeLocation(x, y)
+        return (
+            0 <= ml.row < self.num_rows
+            and 0 <= ml.col < self.num_columns
+            and self._cells[ml.row * self.num_columns + ml.col] != _BLOCKED
+        )
+
+    def is_goal(self, ml: MazeLocation) -> bool:
+        return self._cells[ml.row * self.num_columns + ml.col] == _GOAL
+
+    def is_goal_index(self, index: int) -> bool:
+        return self._cells[index] == _GOAL
+
+    def successor_indices(self, index: int) -> List[int]:
+        cells: bytearray = self._cells
+        cols: int = self.num_columns
+        neighbors: List[int] = []
+        if index >= cols and cells[index - cols] != _BLOCKED:
+            neighbors.append(index - cols)
+        if index + cols < len(cells) and cells[index + cols] != _BLOCKED:
+            neighbors.append(index + cols)
+        col: int = index % cols
+        if col > 0 and cells[index - 1] != _BLOCKED:
+            neighbors.append(index - 1)
+        if col < cols - 1 and cells[index + 1] != _BLOCKED:
+            neighbors.append(index + 1)
+        return neighbors
+
+    def successors(self, ml: MazeLocation) -> List[MazeLocation]:
+        return [
+            self.location_of(index)
+            for index in self.successor_indices(self.index_of(ml))
+        ]
+
+    def open_cells(self) -> bytearray:
+        """Row-major flags, 1 for every cell that is not BLOCKED"""
+        return self._cells.translate(_OPEN_TABLE)
+
+    def mark(self, path: List[MazeLocation]):
+        self.mark_indices([self.index_of(ml) for ml in path])
+
+    def mark_indices(self, path: List[int]):
+        cells: bytearray = self._cells
+        for index in path:
+            if cells[index] == _EMPTY:
+                cells[index] = _PATH
+
+    def clear(self):
+        self._cells = self._cells.translate(_CLEAR_TABLE)
+
+
+class MazeAnalysis:
+    """Connected regions of a maze and cached distance fields to its goals
+
+    Regions are labelled in one flood fill over open_cells(), after which
+    reachability between any two cells is a lookup. distance_field() runs a
+    single BFS outward from a goal; any start's path to that goal is then
+    read off by stepping to a neighbor one closer each move. Results are
+    recomputed on the next query after the maze's version changes.
+    """
+
+    def __init__(self, maze: Union[Maze, CompactMaze]) -> None:
+        self.maze: Union[Maze, CompactMaze] = maze
+        self._version: int = -1
+        self._open: bytearray = bytearray()
+        self._labels: array = array("q")
+        self._region_count: int = 0
+        self._fields: Dict[int, array] = {}
+
+    def _refresh(self) -> None:
+        if self._version == self.maze.version:
+            return
+        self._open = self.maze.open_cells()
+        self._labels = array("q", [-1]) * len(self._open)
+        self._region_count = 0
+        self._fields = {}
+        for index, is_open in enumerate(self._open):
+            if is_open and self._labels[index] < 0:
+                self._flood(index, self._labels, self._region_count)
+                self._region_count += 1
+        self._version = self.maze.version
+
+    def _neighbors(self, index: int) -> List[int]:
+        cols: int = self.maze.num_columns
+        neighbors: List[int] = []
+        if index >= cols:
+            neighbors.append(index - cols)
+        if index + cols < len(self._open):
+            neighbors.append(index + cols)
+        col: int = index % cols
+        if col > 0:
+            neighbors.append(index - 1)
+        if col < cols - 1:
+            neighbors.append(index + 1)
+        return neighbors
+
+    def _flood(self, source: int, values: array, first: int, step: int = 0) -> None:
+        """BFS from source, setting values to first, first + step, ..."""
+        open_cells: bytearray = self._open
+        values[source] = first
+        level: List[int] = [source]
+        while level:
+            first += step
+            next_level: List[int] = []
+            for index in level:
+                for neighbor in self._neighbors(index):
+                    if open_cells[neighbor] and values[neighbor] < 0:
+                        values[neighbor] = first
+                        next_level.append(neighbor)
+            level = next_level
+
+    def _index_of(self, ml: MazeLocation) -> int:
+        return ml.row * self.maze.num_columns + ml.col
+
+    @property
+    def region_count(self) -> int:
+        self._refresh()
+        return self._region_count
+
+    def region_of(self, ml: MazeLocation) -> int:
+        """Label of the region containing ml, or -1 if ml is blocked"""
+        self._refresh()
+        return self._labels[self._index_of(ml)]
+
+    def connected(self, first: MazeLocation, second: MazeLocation) -> bool:
+        label: int = self.region_of(first)
+        return label >= 0 and label == self.region_of(second)
+
+    def is_solvable(self) -> bool:
+        return self.connected(self.maze.start, self.maze.goal)
+
+    def distance_field(self, goal: Optional[MazeLocation] = None) -> array:
+        """Steps from every cell to goal (default: the maze's), -1 if none"""
+        self._refresh()
+        target: int = self._index_of(self.maze.goal if goal is None else goal)
+        field: Optional[array] = self._fields.get(target)
+        if field is None:
+            field = array("q", [-1]) * len(self._open)
+            if self._open[target]:
+                self._flood(target, field, 0, 1)
+            self._fields[target] = field
+        return field
+
+    def distance(
+        self, start: Optional[MazeLocation] = None, goal: Optional[MazeLocation] = None
+    ) -> Optional[int]:
+        steps: int = self.distance_field(goal)[
+            self._index_of(self.maze.start if start is None else start)
+        ]
+        return None if steps < 0 else steps
+
+    def path(
+        self, start: Optional[MazeLocation] = None, goal: Optional[MazeLocation] = None
+    ) -> List[MazeLocation]:
+        """Shortest path from start to goal by descending the distance field
+
+        Defaults to the maze's start and goal. Returns every cell on the path,
+        like node_to_path, or an empty list if the goal is unreachable.
+        """
+        field: array = self.distance_field(goal)
+        current: int = self._index_of(self.maze.start if start is None else start)
+        if field[current] < 0:
+            return []
+        cols: int = self.maze.num_columns
+        path: List[MazeLocation] = [MazeLocation(*divmod(current, cols))]
+        while field[current] > 0:
+            closer: int = field[current] - 1
+            current = next(n for n in self._neighbors(current) if field[n] == closer)
+            path.append(MazeLocation(*divmod(current, cols)))
+        return path
+
+
+# bytes.translate table turning 0/1 flags into "0"/"1" digits for int(_, 2)
+_DIGIT_TABLE: bytes = bytes(48 + (b != 0) for b in range(256))
+
+
+def _to_bits(flags: bytes) -> int:
+    """Pack row-major 0/1 cell flags into an int, cell i in bit i"""
+    if not flags:
+        return 0
+    return int(flags.translate(_DIGIT_TABLE)[::-1], 2)
+
+
+class Wavefront:
+    """Distances to the nearest of several goals, by bitset wavefront BFS
+
+    Each cell is one bit of a Python int, so a whole BFS level is expanded
+    with a handful of shifts and ANDs: by 1 for left/right moves, masked so
+    rows do not wrap, and by num_columns for up/down moves. Distances are
+    kept as bit planes, plane k holding bit k of every cell's distance, so
+    path() can descend from any start to its nearest goal with no search.
+    If starts are given, the sweep stops once all of them are reached.
+    """
+
+    def __init__(
+        self,
+        maze: Union[Maze, CompactMaze],
+        goals: Optional[List[MazeLocation]] = None,
+        starts: Optional[List[MazeLocation]] = None,
+    ) -> None:
+        self.maze: Union[Maze, CompactMaze] = maze
+        rows: int = maze.num_rows
+        cols: int = maze.num_columns
+        open_bits: int = _to_bits(maze.open_cells())
+        unvisited: int = open_bits
+        # Cells a rightward (leftward) move can land on without wrapping rows
+        from_left: int = _to_bits(bytes([0] + [1] * (cols - 1)) * rows)
+        from_right: int = _to_bits(bytes([1] * (cols - 1) + [0]) * rows)
+        pending: int = 0
+        for ml in starts or []:
+            pending |= 1 << (ml.row * cols + ml.col)
+
+        frontier: int = 0
+        for ml in [maze.goal] if goals is None else goals:
+            frontier |= 1 << (ml.row * cols + ml.col)
+        frontier &= unvisited
+        unvisited ^= frontier
+        planes: List[int] = []
+        distance: int = 0
+        while frontier:
+            for k in range(distance.bit_length()):
+                if distance >> k & 1:
+                    if k == len(planes):
+                        planes.append(0)
+                    planes[k] |= frontier
+            if pending:
+                pending &= ~frontier
+                if not pending:
+                    break
+            frontier = (
+                (frontier << 1 & from_left)
+                | (frontier >> 1 & from_right)
+                | frontier << cols
+                | frontier >> cols
+            ) & unvisited
+            unvisited ^= frontier
+            distance += 1
+
+        # Every level leaves unvisited as it is formed, even if never expanded
+        length: int = (rows * cols + 7) // 8
+        self._reached: bytes = (open_bits ^ unvisited).to_bytes(length, "little")
+        self._planes: List[bytes] = [
+            plane.to_bytes(length, "little") for plane in planes
+        ]
+
+    def _distance_at(self, index: int) -> int:
+        byte: int = index >> 3
+        bit: int = index & 7
+        if not self._reached[byte] >> bit & 1:
+            return -1
+        distance: int = 0
+        for k, plane in enumerate(self._planes):
+            distance |= (plane[byte] >> bit & 1) << k
+        return distance
+
+    def distance(self, ml: MazeLocation) -> Optional[int]:
+        """Steps from ml to the nearest goal, None if unreachable or unswept"""
+        steps: int = self._distance_at(ml.row * self.maze.num_columns + ml.col)
+        return None if steps < 0 else steps
+
+    def path(self, start: Optional[MazeLocation] = None) -> List[MazeLocation]:
+        """Shortest path from start (default: the maze's) to its nearest goal
+
+        Returns every cell on the path, like node_to_path, or an empty list
+        if no goal is reachable.
+        """
+        cols: int = self.maze.num_columns
+        size: int = self.maze.num_rows * cols
+        if start is None:
+            start = self.maze.start
+        current: int = start.row * cols + start.col
+        steps: int = self._distance_at(current)
+        if steps < 0:
+            return []
+        path: List[MazeLocation] = [start]
+        while steps > 0:
+            steps -= 1
+            col: int = current % cols
+            for neighbor in (
+                current - cols,
+                current + cols,
+                current - 1 if col > 0 else -1,
+                current + 1 if col < cols - 1 else -1,
+            ):
+                if 0 <= neighbor < size and self._distance_at(neighbor) == steps:
+                    current = neighbor
+                    break
+            path.append(MazeLocation(*divmod(current, cols)))
+        return path
+
+
+def wavefront_bfs(
+    maze: Union[Maze, CompactMaze],
+    starts: Optional[List[MazeLocation]] = None,
+    goals: Optional[List[MazeLocation]] = None,
+) -> List[List[MazeLocation]]:
+    """Shortest path from each start to its nearest goal, in one sweep
+
+    starts defaults to the maze's start and goals to its goal. Paths are
+    returned in the order of starts, empty where no goal is reachable, and
+    can be passed straight to mark().
+    """
+    if starts is None:
+        starts = [maze.start]
+    wavefront: Wavefront = Wavefront(maze, goals, starts)
+    return [wavefront.path(start) for start in starts]
+
+
+def jump_point_search(maze: Union[Maze, CompactMaze]) -> List[MazeLocation]:
+    """Optimal start-to-goal path using 4-connected Jump Point Search
+
+    A* runs over jump points only: straight runs are skipped until a cell
+    with a forced neighbor (or the goal) is reached, and successors are
+    pruned by the direction of travel. Moving vertically also stops wherever
+    a horizontal jump would find a jump point. Returns every cell on the
+    path, like node_to_path, or an empty list if the goal is unreachable.
+
+    Horizontal jumps are answered from per-row bitsets built once up front,
+    so the vertical scans, which test a horizontal jump at every step, never
+    rescan a row. Ties in f are broken toward the deeper node.
+    """
+    rows: int = maze.num_rows
+    cols: int = maze.num_columns
+    open_cells: bytearray = maze.open_cells()
+    goal_row, goal_col = maze.goal
+    goal: int = goal_row * cols + goal_col
+
+    def walkable(row: int, col: int) -> bool:
+        return 0 <= row < rows and 0 <= col < cols and open_cells[row * cols + col]
+
+    # Row bitsets for each direction of travel (0: left, 1: right), laid out
+    # so travel runs toward bit 0: bit c is column c going left and column
+    # cols - 1 - c going right. jump_points holds the cells where a jump in
+    # that direction stops, and reaches the cells from which one is found.
+    full: int = (1 << cols) - 1
+    open_rows: List[List[int]] = [[0] * (rows + 2), [0] * (rows + 2)]
+    for row in range(rows):
+        digits: bytes = open_cells[row * cols : (row + 1) * cols].translate(
+            _DIGIT_TABLE
+        )
+        open_rows[0][row + 1] = int(digits[::-1], 2) if cols else 0
+        open_rows[1][row + 1] = int(digits, 2) if cols else 0
+    blocked_rows: List[List[int]] = [[], []]
+    jump_points: List[List[int]] = [[], []]
+    reaches: List[List[int]] = [[], []]
+    for direction, padded in enumerate(open_rows):
+        for row in range(rows):
+            up, here, down = padded[row : row + 3]
+            points: int = here & ((up & ~(up >> 1)) | (down & ~(down >> 1)))
+            if row == goal_row:
+                points |= 1 << (goal_col if direction == 0 else cols - 1 - goal_col)
+            blocked_rows[direction].append(full & ~here)
+            jump_points[direction].append(points)
+            # Adding points carries through each open run from its first
+            # jump point, so the changed bits are the cells that reach one
+            reaches[direction].append((((here + points) ^ here) & here) | points)
+
+    def bit_of(col: int, dc: int) -> int:
+        return col if dc < 0 else cols - 1 - col
+
+    def jump_horizontal(row: int, col: int, dc: int) -> Optional[int]:
+        if not 0 <= col < cols:
+            return None
+        direction: int = dc > 0
+        mask: int = (2 << bit_of(col, dc)) - 1
+        points: int = jump_points[direction][row] & mask
+        if points.bit_length() <= (blocked_rows[direction][row] & mask).bit_length():
+            return None
+        return row * cols + bit_of(points.bit_length() - 1, dc)
+
+    def finds_jump(row: int, col: int, dc: int) -> bool:
+        """True if jump_horizontal(row, col, dc) would find a jump point"""
+        return 0 <= col < cols and reaches[dc > 0][row] >> bit_of(col, dc) & 1 == 1
+
+    def jump_vertical(row: int, col: int, dr: int) -> Optional[int]:
+        while walkable(row, col):
+            if row == goal_row and col == goal_col:
+                return row * cols + col
+            if (walkable(row, col - 1) and not walkable(row - dr, col - 1)) or (
+                walkable(row, col + 1) and not walkable(row - dr, col + 1)
+            ):
+                return row * cols + col
+            if finds_jump(row, col + 1, 1) or finds_jump(row, col - 1, -1):
+                return row * cols + col
+            row += dr
+        return None
+
+    start: int = maze.start.row * cols + maze.start.col
+    costs: Dict[int, int] = {start: 0}
+    parents: Dict[int, Optional[int]] = {start: None}
+    frontier: IndexedPriorityQueue = IndexedPriorityQueue()
+    estimate: int = abs(maze.start.row - goal_row) + abs(maze.start.col - goal_col)
+    frontier.push(start, (estimate, estimate))
+
+    while not frontier.is_empty:
+        current: int = frontier.pop()
+        if current == goal:
+            return _expand_jump_path(parents, goal, cols)
+        row, col = divmod(current, cols)
+        parent: Optional[int] = parents[current]
+        if parent is None:
+            directions: Tuple = ((-1, 0), (1, 0), (0, -1), (0, 1))
+        else:
+            parent_row, parent_col = divmod(parent, cols)
+            dr: int = (row > parent_row) - (row < parent_row)
+            dc: int = (col > parent_col) - (col < parent_col)
+            if dc:
+                directions = ((0, dc), (-1, 0), (1, 0))
+            else:
+                directions = ((dr, 0), (0, -1), (0, 1))
+        for dr, dc in directions:
+            if dc:
+                jump_point = jump_horizontal(row, col + dc, dc)
+            else:
+                jump_point = jump_vertical(row + dr, col, dr)
+            if jump_point is None:
+                continue
+            jump_row, jump_col = divmod(jump_point, cols)
+            new_cost: int = costs[current] + abs(jump_row - row) + abs(jump_col - col)
+            if jump_point not in costs or new_cost < costs[jump_point]:
+                costs[jump_point] = new_cost
+                parents[jump_point] = current
+                estimate = abs(jump_row - goal_row) + abs(jump_col - goal_col)
+                frontier.push_or_decrease(jump_point, (new_cost + estimate, estimate))
+    return []
+
+
+def _expand_jump_path(
+    parents: Dict[int, Optional[int]], goal: int, cols: int
+) -> List[MazeLocation]:
+    """Fill in the straight runs between consecutive jump points"""
+    path: List[MazeLocation] = [MazeLocation(*divmod(goal, cols))]
+    current: int = goal
+    parent: Optional[int] = parents[goal]
+    while parent is not None:
+        row, col = divmod(current, cols)
+        parent_row, parent_col = divmod(parent, cols)
+        dr: int = (parent_row > row) - (parent_row < row)
+        dc: int = (parent_col > col) - (parent_col < col)
+        while (row, col) != (parent_row, parent_col):
+            row += dr
+            col += dc
+            path.append(MazeLocation(row, col))
+        current, parent = parent, parents[parent]
+    path.reverse()
+    return path
+
+
 def euclidean_distance(goal: MazeLocation) -> Callable[[MazeLocation], float]:
     def distance(ml: MazeLocation) -> float:
         xdist: int = ml.col - goal.col
@@ -161,3 +709,44 @@ if __name__ == "__main__":
     else:
         print(m)
         print("Unsolvable")
+
+    m.clear()
+    print("Region analysis solution")
+    start = time.time()
+    analysis = MazeAnalysis(m)
+    path = analysis.path() if analysis.is_solvable() else []
+    end = time.time()
+    print(f"Path length: {len(path)}, Time: {end - start}")
+    print(f"Open regions: {analysis.region_count}")
+    if path:
+        m.mark(path)
+        print(m)
+    else:
+        print(m)
+        print("Unsolvable")
+
+    m.clear()
+    print("Wavefront BFS solution")
+    start = time.time()
+    path = wavefront_bfs(m)[0]
+    end = time.time()
+    print(f"Path length: {len(path)}, Time: {end - start}")
+    if path:
+        m.mark(path)
+        print(m)
+    else:
+        print(m)
+        print("Unsolvable")
+
+    m.clear()
+    print("Jump point search solution")
+    start = time.time()
+    path = jump_point_search(m)
+    end = time.time()
+    print(f"Path length: {len(path)}, Time: {end - start}")
+    if path:
+        m.mark(path)
+        print(m)
+    else:
+        print(m)
+        print("Unsolvable")
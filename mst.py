@@ -1,7 +1,13 @@
-from typing import List, Optional, Set, TypeVar
+from array import array
+from multiprocessing import Pool, cpu_count
+from multiprocessing.sharedctypes import RawArray
+import random
+from typing import Dict, Generic, List, Optional, Sequence, Set, Tuple, TypeVar
 
-from edge import WeightedEdge
-from generic_search import PriorityQueue
+from disjoint_set import DisjointSet
+from edge import EdgeStore, WeightedEdge
+from generic_search import IndexedPriorityQueue
+from link_cut_tree import LinkCutTree
 from weighted_graph import WeightedGraph
 
 
@@ -15,24 +21,312 @@ def total_weight(wp: WeightedPath) -> float:
 
 def mst(wg: WeightedGraph, start: int = 0) -> Optional[WeightedPath]:
     path: WeightedPath = []
-    visited: Set[V] = set()
-    pq: PriorityQueue = PriorityQueue()
+    visited: Set[int] = set()
+    # Cheapest known edge into each unvisited vertex; the queue holds each
+    # vertex once, keyed by that edge's weight
+    best_edges: Dict[int, WeightedEdge] = {}
+    pq: IndexedPriorityQueue = IndexedPriorityQueue()
 
-    visited.add(start)
-    for edge in wg.edges_for_index(start):
-        pq.push(edge)
+    def visit(index: int) -> None:
+        visited.add(index)
+        for edge in wg.edges_for_index(index):
+            if edge.v in visited:
+                continue
+            if pq.push_or_decrease(edge.v, edge.weight):
+                best_edges[edge.v] = edge
 
-    while not pq.is_empty and len(visited) < wg.vertex_count:
-        edge: WeightedEdge = pq.pop()
-        if edge.v in visited:
-            continue
-        visited.add(edge.v)
-        path.append(edge)
-        for edge in wg.edges_for_index(edge.v):
-            pq.push(edge)
+    visit(start)
+    while not pq.is_empty:
+        v: int = pq.pop()
+        path.append(best_edges.pop(v))
+        visit(v)
     return path
 
 
+def kruskal(wg: WeightedGraph) -> WeightedPath:
+    """Minimum spanning forest: one tree per connected component
+
+    Each undirected edge is read once into flat arrays, sorted once by
+    weight, then accepted whenever it joins two different components.
+    """
+    us, vs, weights = _edge_arrays(wg)
+    forest: WeightedPath = []
+    components: DisjointSet = DisjointSet(wg.vertex_count)
+    for i in sorted(range(len(weights)), key=weights.__getitem__):
+        if components.union(us[i], vs[i]):
+            forest.append(WeightedEdge(us[i], vs[i], weights[i]))
+            if components.set_count == 1:
+                break
+    return forest
+
+
+def _edge_arrays(wg: WeightedGraph) -> Tuple[array, array, array]:
+    """Each undirected edge once, as parallel (u, v, weight) arrays"""
+    if isinstance(wg, WeightedGraph):
+        store: EdgeStore = wg.edge_store
+        return store.us, store.vs, store.weights
+    us: array = array("q")
+    vs: array = array("q")
+    weights: array = array("d")
+    for u in range(wg.vertex_count):
+        for v, weight in zip(wg.neighbor_indices(u), wg.neighbor_weights(u)):
+            if u < v:
+                us.append(u)
+                vs.append(v)
+                weights.append(weight)
+    return us, vs, weights
+
+
+# Buffers of a boruvka pool, set once per worker by _init_boruvka_worker:
+# (contracted first endpoints, contracted second endpoints, weights,
+# root of each earlier component, surviving edge ids)
+_BoruvkaState = Tuple[
+    Sequence[int], Sequence[int], Sequence[float], Sequence[int], Sequence[int]
+]
+_boruvka_state: Optional[_BoruvkaState] = None
+
+
+def _int_view(buffer: RawArray) -> memoryview:
+    return memoryview(buffer).cast("B").cast("q")
+
+
+def _shared_ints(values: Sequence[int]) -> RawArray:
+    """RawArray of int64 holding a copy of values"""
+    shared: RawArray = RawArray("q", max(1, len(values)))
+    view: memoryview = _int_view(shared)
+    view[: len(values)] = memoryview(array("q", values))
+    view.release()
+    return shared
+
+
+def _init_boruvka_worker(
+    ends: Tuple[RawArray, RawArray], weights: array, roots: RawArray, live: RawArray
+) -> None:
+    global _boruvka_state
+    _boruvka_state = (
+        _int_view(ends[0]),
+        _int_view(ends[1]),
+        weights,
+        _int_view(roots),
+        _int_view(live),
+    )
+
+
+def _contract_edges(
+    state: _BoruvkaState, start: int, end: int
+) -> Tuple[int, Dict[int, Tuple[float, int]]]:
+    """Contract the surviving edges in live[start:end]; find the cheapest
+
+    Each edge's endpoints are moved to their current component roots and
+    edges now inside one component are dropped, compacting the rest to the
+    front of the slice. Returns how many survive, and the cheapest (weight,
+    edge id) leaving each component. Ties are broken by edge id, so every
+    component agrees on one order and the chosen edges never form a cycle.
+    """
+    firsts, seconds, weights, roots, live = state
+    cheapest: Dict[int, Tuple[float, int]] = {}
+    kept: int = start
+    for position in range(start, end):
+        i: int = live[position]
+        a: int = roots[firsts[i]]
+        b: int = roots[seconds[i]]
+        if a == b:
+            continue
+        firsts[i] = a
+        seconds[i] = b
+        live[kept] = i
+        kept += 1
+        key: Tuple[float, int] = (weights[i], i)
+        best: Optional[Tuple[float, int]] = cheapest.get(a)
+        if best is None or key < best:
+            cheapest[a] = key
+        best = cheapest.get(b)
+        if best is None or key < best:
+            cheapest[b] = key
+    return kept - start, cheapest
+
+
+def _contract_edges_task(
+    bounds: Tuple[int, int]
+) -> Tuple[int, Dict[int, Tuple[float, int]]]:
+    return _contract_edges(_boruvka_state, *bounds)
+
+
+def boruvka(wg: WeightedGraph, workers: Optional[int] = None) -> WeightedPath:
+    """Minimum spanning forest by Boruvka rounds split across processes
+
+    Each round, workers scan slices of the surviving edges for the cheapest
+    edge leaving every component; all of those edges join the forest and
+    their components merge, so there are at most log2(V) rounds. The scan
+    also contracts: endpoints move to their component roots and edges inside
+    a component are dropped, so later rounds only see edges between
+    components. Between rounds this process updates the roots of merged
+    components only. workers defaults to the CPU count; 1 runs in this
+    process.
+    """
+    us, vs, weights = _edge_arrays(wg)
+    edge_count: int = len(weights)
+    if workers is None:
+        workers = cpu_count()
+    ends: Tuple[RawArray, RawArray] = (_shared_ints(us), _shared_ints(vs))
+    roots: RawArray = _shared_ints(range(wg.vertex_count))
+    live: RawArray = _shared_ints(range(edge_count))
+    state: _BoruvkaState = (
+        _int_view(ends[0]),
+        _int_view(ends[1]),
+        weights,
+        _int_view(roots),
+        _int_view(live),
+    )
+    # Several slices per worker, as slices shrink unevenly between rounds
+    step: int = max(1, -(-edge_count // max(1, workers * 4)))
+    slices: List[Tuple[int, int]] = [
+        (start, min(start + step, edge_count)) for start in range(0, edge_count, step)
+    ]
+    pool: Optional[Pool] = None
+    if workers > 1 and len(slices) > 1:
+        pool = Pool(
+            workers,
+            initializer=_init_boruvka_worker,
+            initargs=(ends, weights, roots, live),
+        )
+
+    forest: WeightedPath = []
+    components: DisjointSet = DisjointSet(wg.vertex_count)
+    try:
+        while slices and components.set_count > 1:
+            if pool is None:
+                results = [_contract_edges(state, *bounds) for bounds in slices]
+            else:
+                results = pool.map(_contract_edges_task, slices)
+            slices = [
+                (start, start + kept)
+                for (start, _), (kept, _) in zip(slices, results)
+                if kept
+            ]
+            cheapest: Dict[int, Tuple[float, int]] = {}
+            for _, partial in results:
+                for component, key in partial.items():
+                    best: Optional[Tuple[float, int]] = cheapest.get(component)
+                    if best is None or key < best:
+                        cheapest[component] = key
+            for i in sorted({i for _, i in cheapest.values()}):
+                if components.union(us[i], vs[i]):
+                    forest.append(WeightedEdge(us[i], vs[i], weights[i]))
+            # Every component that chose an edge merged; no other root moved
+            root_view: memoryview = state[3]
+            for component in cheapest:
+                root_view[component] = components.find(component)
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+        for view in state:
+            if isinstance(view, memoryview):
+                view.release()
+    return forest
+
+
+class DynamicMST(Generic[V]):
+    """Minimum spanning forest of a WeightedGraph, kept current as it grows
+
+    Each new edge either links two trees or, by the cycle property, replaces
+    the heaviest edge on the tree path between its endpoints if it is
+    lighter. Tree paths are queried with a link-cut tree, so an insert costs
+    O(log V) amortized instead of a full rebuild. Edges may be added through
+    this object or straight to the graph; the graph's edge store only ever
+    grows, so edges past the last one seen are inserted on the next call.
+
+    >>> wg = WeightedGraph(list(range(4)))
+    >>> dynamic = DynamicMST(wg)
+    >>> dynamic.add_edge_by_indices(0, 1, 5)
+    >>> wg.add_edge_by_indices(1, 2, 1)
+    >>> dynamic.add_edge_by_indices(2, 3, 1)
+    >>> dynamic.total_weight == total_weight(kruskal(wg)) == 7.0
+    True
+    >>> wg.add_edge_by_indices(0, 3, 2)
+    >>> dynamic.total_weight, len(dynamic.edges)
+    (4.0, 3)
+    """
+
+    def __init__(self, wg: WeightedGraph[V]) -> None:
+        self.graph: WeightedGraph[V] = wg
+        self._total_weight: float = 0.0
+        # Vertex i is link-cut node _vertex_nodes[i]; each tree edge is a node
+        # of its own, valued by its weight, linked between its two endpoints
+        self._tree: LinkCutTree = LinkCutTree()
+        self._vertex_nodes: List[int] = []
+        self._edges: Dict[int, WeightedEdge] = {}
+        self._free_nodes: List[int] = []
+        for edge in kruskal(wg):
+            self._insert(edge)
+        self._seen_edges: int = len(wg.edge_store)
+
+    @property
+    def edges(self) -> WeightedPath:
+        self._sync()
+        return list(self._edges.values())
+
+    @property
+    def total_weight(self) -> float:
+        self._sync()
+        return self._total_weight
+
+    def add_vertex(self, vertex: V) -> int:
+        index: int = self.graph.add_vertex(vertex)
+        self._sync()
+        return index
+
+    def add_edge_by_indices(self, u: int, v: int, w: float) -> None:
+        self.graph.add_edge_by_indices(u, v, w)
+        self._sync()
+
+    def add_edge_by_vertices(self, first: V, second: V, weight: float) -> None:
+        u: int = self.graph.index_of(first)
+        v: int = self.graph.index_of(second)
+        self.add_edge_by_indices(u, v, weight)
+
+    def _sync(self) -> None:
+        """Insert every edge added to the graph since the last call"""
+        self._sync_vertices()
+        store: EdgeStore = self.graph.edge_store
+        for i in range(self._seen_edges, len(store)):
+            self._insert(WeightedEdge(store.us[i], store.vs[i], store.weights[i]))
+        self._seen_edges = len(store)
+
+    def _sync_vertices(self) -> None:
+        while len(self._vertex_nodes) < self.graph.vertex_count:
+            self._vertex_nodes.append(self._tree.add_node())
+
+    def _insert(self, edge: WeightedEdge) -> None:
+        self._sync_vertices()
+        if edge.u == edge.v:
+            return
+        a: int = self._vertex_nodes[edge.u]
+        b: int = self._vertex_nodes[edge.v]
+        if self._tree.connected(a, b):
+            heaviest: int = self._tree.path_max(a, b)
+            if self._tree.values[heaviest] <= edge.weight:
+                return
+            self._remove(heaviest)
+        if self._free_nodes:
+            node: int = self._free_nodes.pop()
+            self._tree.set_value(node, edge.weight)
+        else:
+            node = self._tree.add_node(edge.weight)
+        self._tree.link(node, a)
+        self._tree.link(node, b)
+        self._edges[node] = edge
+        self._total_weight += edge.weight
+
+    def _remove(self, node: int) -> None:
+        edge: WeightedEdge = self._edges.pop(node)
+        self._tree.cut(node, self._vertex_nodes[edge.u])
+        self._tree.cut(node, self._vertex_nodes[edge.v])
+        self._free_nodes.append(node)
+        self._total_weight -= edge.weight
+
+
 def print_weighted_path(wg: WeightedGraph, wp: WeightedPath):
     for edge in wp:
         print(f"{wg.vertex_at(edge.u)} {edge.weight}> {wg.vertex_at(edge.v)}")
@@ -91,3 +385,30 @@ if __name__ == "__main__":
 
     wp = mst(city_graph2)
     print_weighted_path(city_graph2, wp)
+
+    print("Kruskal")
+    print_weighted_path(city_graph2, kruskal(city_graph2))
+
+    print("Boruvka")
+    print_weighted_path(city_graph2, boruvka(city_graph2))
+
+    # DynamicMST must match a from-scratch kruskal after every insert
+    cities: List[str] = [
+        city_graph2.vertex_at(i) for i in range(city_graph2.vertex_count)
+    ]
+    dynamic: DynamicMST[str] = DynamicMST(WeightedGraph(cities))
+    store: EdgeStore = city_graph2.edge_store
+    for u, v, weight in zip(store.us, store.vs, store.weights):
+        dynamic.add_edge_by_indices(u, v, weight)
+        expected: float = sum(edge.weight for edge in kruskal(dynamic.graph))
+        assert dynamic.total_weight == expected, (dynamic.total_weight, expected)
+    random.seed(0)
+    random_graph: DynamicMST[int] = DynamicMST(WeightedGraph(list(range(100))))
+    for _ in range(1_000):
+        random_graph.add_edge_by_indices(
+            random.randrange(100), random.randrange(100), random.randint(1, 50)
+        )
+        expected = sum(edge.weight for edge in kruskal(random_graph.graph))
+        assert random_graph.total_weight == expected
+    print("Dynamic MST")
+    print_weighted_path(city_graph2, dynamic.edges)
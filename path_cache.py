@@ -0,0 +1,140 @@
+from array import array
+from collections import OrderedDict
+from typing import Generic, List, Optional, Tuple, TypeVar, Union
+
+from csr_graph import CSRGraph, WeightedCSRGraph
+from dijkstra import dijkstra
+from graph import Graph
+from weighted_graph import WeightedGraph
+
+
+V = TypeVar("V")
+# Distances and predecessors from one root; predecessor -1 marks the root
+# and unreachable vertices, which also have a negative distance
+Tree = Tuple[array, array]
+
+
+def bfs_tree(graph: Union[Graph, CSRGraph], root: int) -> Tree:
+    """Hop distances and BFS predecessors from root to every vertex index"""
+    distances: array = array("q", [-1]) * graph.vertex_count
+    predecessors: array = array("q", [-1]) * graph.vertex_count
+    distances[root] = 0
+    level: List[int] = [root]
+    depth: int = 0
+    while level:
+        depth += 1
+        next_level: List[int] = []
+        for u in level:
+            for v in graph.neighbor_indices(u):
+                if distances[v] < 0:
+                    distances[v] = depth
+                    predecessors[v] = u
+                    next_level.append(v)
+        level = next_level
+    return distances, predecessors
+
+
+def dijkstra_tree(graph: Union[Graph, CSRGraph], root: int) -> Tree:
+    """dijkstra from root, packed into arrays (distance -1.0 if unreachable)"""
+    distances, predecessors = dijkstra(graph, root)
+    return (
+        array("d", [-1.0 if d is None else d for d in distances]),
+        array("q", [-1 if p is None else p for p in predecessors]),
+    )
+
+
+_TREE_BUILDERS = {"bfs": bfs_tree, "dijkstra": dijkstra_tree}
+
+
+class PathCache(Generic[V]):
+    """LRU cache of whole single-source search trees over one graph
+
+    A query from A builds the full tree rooted at A, which then answers every
+    later A -> X query. Graphs are undirected, so a cached tree rooted at X
+    also answers A -> X. All trees are dropped as soon as graph.version
+    changes. max_bytes caps the memory held by the cached arrays.
+    """
+
+    def __init__(
+        self, graph: Union[Graph[V], CSRGraph[V]], max_bytes: int = 64 << 20
+    ) -> None:
+        self.graph: Union[Graph[V], CSRGraph[V]] = graph
+        self.max_bytes: int = max_bytes
+        self.nbytes: int = 0
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+        self.invalidations: int = 0
+        self._version: int = graph.version
+        self._trees: "OrderedDict[Tuple[str, int], Tree]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._trees)
+
+    def clear(self) -> None:
+        self._trees.clear()
+        self.nbytes = 0
+
+    def bfs(self, start: V, goal: V) -> List[V]:
+        """Fewest-hop vertex path, [] if goal is unreachable"""
+        return self._query("bfs", start, goal)[1]
+
+    def shortest_path(self, start: V, goal: V) -> Tuple[Optional[float], List[V]]:
+        """Weighted (distance, vertex path), (None, []) if goal is unreachable
+
+        Edges of an unweighted graph count as weight 1, so this shares the
+        cached BFS trees.
+        """
+        if isinstance(self.graph, (WeightedGraph, WeightedCSRGraph)):
+            return self._query("dijkstra", start, goal)
+        distance, path = self._query("bfs", start, goal)
+        return (None if distance is None else float(distance)), path
+
+    def _query(
+        self, kind: str, start: V, goal: V
+    ) -> Tuple[Optional[float], List[V]]:
+        if self.graph.version != self._version:
+            self.clear()
+            self.invalidations += 1
+            self._version = self.graph.version
+        u: int = self.graph.index_of(start)
+        v: int = self.graph.index_of(goal)
+        tree: Optional[Tree] = self._lookup(kind, u)
+        reverse: bool = False
+        if tree is None:
+            tree = self._lookup(kind, v)
+            reverse = tree is not None
+        if tree is None:
+            self.misses += 1
+            tree = _TREE_BUILDERS[kind](self.graph, u)
+            self._store(kind, u, tree)
+        else:
+            self.hits += 1
+        if reverse:
+            u, v = v, u
+        distances, predecessors = tree
+        if distances[v] < 0:
+            return None, []
+        path: List[int] = [v]
+        while path[-1] != u:
+            path.append(predecessors[path[-1]])
+        if not reverse:
+            path.reverse()
+        return distances[v], [self.graph.vertex_at(i) for i in path]
+
+    def _lookup(self, kind: str, root: int) -> Optional[Tree]:
+        tree: Optional[Tree] = self._trees.get((kind, root))
+        if tree is not None:
+            self._trees.move_to_end((kind, root))
+        return tree
+
+    def _store(self, kind: str, root: int, tree: Tree) -> None:
+        size: int = sum(len(a) * a.itemsize for a in tree)
+        if size > self.max_bytes:
+            return
+        self._trees[(kind, root)] = tree
+        self.nbytes += size
+        while self.nbytes > self.max_bytes:
+            _, evicted = self._trees.popitem(last=False)
+            self.nbytes -= sum(len(a) * a.itemsize for a in evicted)
+            self.evictions += 1
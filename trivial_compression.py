@@ -1,5 +1,8 @@
+import mmap
 import random
+import struct
 import sys
+from typing import IO, Iterator, List, Union
 
 
 class CompressedGene:
@@ -40,6 +43,149 @@ class CompressedGene:
         return gene[::-1]
 
 
+# bytes.translate table mapping A, C, G, T (either case) to 0-3, else 0xFF
+_PACK_TABLE: bytes = bytes(
+    "ACGT".find(chr(b).upper()) if chr(b) in "ACGTacgt" else 0xFF
+    for b in range(256)
+)
+# Tables unpacking the nucleotide at bit offset 6, 4, 2 and 0 of a byte
+_UNPACK_TABLES = [
+    bytes(b"ACGT"[(b >> shift) & 0b11] for b in range(256)) for shift in (6, 4, 2, 0)
+]
+_FILE_HEADER = struct.Struct("<4sQ")
+_FILE_MAGIC = b"CGN2"
+
+
+class PackedGene:
+    """Nucleotides packed four to a byte, first nucleotide in the high bits
+
+    Packing and unpacking go through bytes.translate and big-int shifts over
+    whole chunks, so both are linear in the gene length. Genes loaded from
+    a file are memory-mapped and read-only.
+    """
+
+    def __init__(self, gene: Union[str, bytes] = "") -> None:
+        self._data: Union[bytearray, memoryview] = bytearray()
+        self.length: int = 0
+        self.extend(gene)
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __getitem__(self, index: int) -> str:
+        if index < 0:
+            index += self.length
+        if not 0 <= index < self.length:
+            raise IndexError("gene index out of range")
+        bits: int = self._data[index >> 2] >> (6 - 2 * (index & 3))
+        return "ACGT"[bits & 0b11]
+
+    def __str__(self) -> str:
+        data: bytes = bytes(self._data)
+        out: bytearray = bytearray(len(data) * 4)
+        for offset, table in enumerate(_UNPACK_TABLES):
+            out[offset::4] = data.translate(table)
+        return out[: self.length].decode("ascii")
+
+    @property
+    def nbytes(self) -> int:
+        return len(self._data)
+
+    def extend(self, chunk: Union[str, bytes]) -> None:
+        codes: bytes = _to_codes(chunk)
+        spare: int = -self.length % 4
+        if spare and codes:
+            # Top up the partially filled last byte before packing in bulk
+            for code in codes[:spare]:
+                self._data[-1] |= code << (6 - 2 * (self.length & 3))
+                self.length += 1
+            codes = codes[spare:]
+        self._data += _pack_codes(codes)
+        self.length += len(codes)
+
+    def save(self, path: str) -> None:
+        with open(path, "wb") as f:
+            f.write(_FILE_HEADER.pack(_FILE_MAGIC, self.length))
+            f.write(self._data)
+
+    @classmethod
+    def load(cls, path: str) -> "PackedGene":
+        """Memory-map a gene written by save or compress_stream"""
+        with open(path, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, length = _FILE_HEADER.unpack_from(mapped)
+        if magic != _FILE_MAGIC:
+            raise ValueError(f"{path} is not a packed gene file")
+        gene: PackedGene = cls()
+        gene._data = memoryview(mapped)[_FILE_HEADER.size :]
+        gene.length = length
+        return gene
+
+    @classmethod
+    def compress_stream(
+        cls, stream: IO, path: str, chunk_size: int = 1 << 20
+    ) -> "PackedGene":
+        """Pack a raw or FASTA stream into a file chunk by chunk, then map it"""
+        length: int = 0
+        carry: bytes = b""
+        with open(path, "wb") as f:
+            f.write(_FILE_HEADER.pack(_FILE_MAGIC, 0))
+            for chunk in read_fasta(stream, chunk_size):
+                codes: bytes = carry + _to_codes(chunk)
+                whole: int = len(codes) - len(codes) % 4
+                f.write(_pack_codes(codes[:whole]))
+                carry = codes[whole:]
+                length += whole
+            f.write(_pack_codes(carry))
+            length += len(carry)
+            f.seek(0)
+            f.write(_FILE_HEADER.pack(_FILE_MAGIC, length))
+        return cls.load(path)
+
+
+def _to_codes(chunk: Union[str, bytes]) -> bytes:
+    if isinstance(chunk, str):
+        chunk = chunk.encode("ascii")
+    codes: bytes = chunk.translate(_PACK_TABLE)
+    if 0xFF in codes:
+        bad: int = chunk[codes.index(0xFF)]
+        raise ValueError(f"Invalid nucleotide: '{chr(bad)}'")
+    return codes
+
+
+def _pack_codes(codes: bytes) -> bytes:
+    """Pack 0-3 codes four to a byte, zero-padding the final byte"""
+    size: int = (len(codes) + 3) // 4
+    codes = codes + bytes(size * 4 - len(codes))
+    packed: int = 0
+    for offset in range(4):
+        # Each code is at most 3, so the shifts never carry into a neighbor
+        packed |= int.from_bytes(codes[offset::4], "big") << (6 - 2 * offset)
+    return packed.to_bytes(size, "big")
+
+
+def read_fasta(stream: IO, chunk_size: int = 1 << 20) -> Iterator[Union[str, bytes]]:
+    """Yield sequence chunks of about chunk_size, skipping '>' header lines
+
+    A stream without header lines is read as one raw sequence. Text and
+    binary streams are both accepted.
+    """
+    pending: List[Union[str, bytes]] = []
+    pending_size: int = 0
+    for line in stream:
+        if line[:1] in (">", b">"):
+            continue
+        line = line.strip()
+        pending.append(line)
+        pending_size += len(line)
+        if pending_size >= chunk_size:
+            yield line[:0].join(pending)
+            pending = []
+            pending_size = 0
+    if pending:
+        yield pending[0][:0].join(pending)
+
+
 def random_gene(length: int = 1000) -> str:
     gene: str = ""
     while len(gene) < length:
@@ -59,3 +205,6 @@ if __name__ == "__main__":
     cg = CompressedGene(gene)
     print(f"Compressed size: {sys.getsizeof(cg.bit_string)}")
     print(f"Compressed and uncompressed are the same: {gene == str(cg)}")
+    pg = PackedGene(gene)
+    print(f"Packed size: {pg.nbytes}")
+    print(f"Packed and uncompressed are the same: {gene == str(pg)}")
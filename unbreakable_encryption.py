@@ -1,34 +1,113 @@
 from secrets import token_bytes
 import sys
-from typing import Tuple
+from typing import BinaryIO, Optional, Tuple, Union
 
 
-def random_key(length: int) -> int:
-    tb: bytes = token_bytes(length)
-    return int.from_bytes(tb, "big")
+def random_key(length: int) -> bytes:
+    return token_bytes(length)
 
 
-def encrypt(message: str) -> Tuple[int, int]:
+def encrypt(message: str) -> Tuple[int, bytes]:
+    """Return the ciphertext and the key; the key is as long as the message
+    in bytes, so decrypt can restore leading zero bytes
+    """
     message_bytes: bytes = message.encode()
-    key: int = random_key(len(message_bytes))
+    key: bytes = random_key(len(message_bytes))
     message_int: int = int.from_bytes(message_bytes, "big")
-    cipher_int: int = message_int ^ key
-    return [cipher_int, key]
+    cipher_int: int = message_int ^ int.from_bytes(key, "big")
+    return cipher_int, key
 
 
-def decrypt(message_int: int, key: int) -> str:
+def decrypt(
+    message_int: int, key: Union[bytes, int], length: Optional[int] = None
+) -> str:
+    """The message length in bytes is taken from a bytes key; for an int key
+    pass length to keep any leading zero bytes
+    """
+    if isinstance(key, bytes):
+        if length is None:
+            length = len(key)
+        key = int.from_bytes(key, "big")
     plaintext_int: int = message_int ^ key
-    plaintext_bytes: bytes = plaintext_int.to_bytes(
-        (plaintext_int.bit_length() + 7) // 8, "big"
-    )
+    if length is None:
+        length = (plaintext_int.bit_length() + 7) // 8
+    plaintext_bytes: bytes = plaintext_int.to_bytes(length, "big")
     return plaintext_bytes.decode()
 
 
+def xor_bytes(data: bytes, key: bytes) -> bytes:
+    """XOR two equal-length buffers, keeping leading and trailing zero bytes"""
+    mixed: int = int.from_bytes(data, "little") ^ int.from_bytes(key, "little")
+    return mixed.to_bytes(len(data), "little")
+
+
+def encrypt_stream(
+    source: BinaryIO,
+    cipher_out: BinaryIO,
+    key_out: BinaryIO,
+    chunk_size: int = 1 << 20,
+) -> int:
+    """One-time pad a binary stream chunk by chunk; returns bytes written
+
+    Only one chunk of plaintext, key and ciphertext is held at a time.
+    """
+    buffer: bytearray = bytearray(chunk_size)
+    view: memoryview = memoryview(buffer)
+    total: int = 0
+    while True:
+        read: int = source.readinto(buffer)
+        if not read:
+            return total
+        key: bytes = random_key(read)
+        cipher_out.write(xor_bytes(view[:read], key))
+        key_out.write(key)
+        total += read
+
+
+def decrypt_stream(
+    cipher_in: BinaryIO,
+    key_in: BinaryIO,
+    plain_out: BinaryIO,
+    chunk_size: int = 1 << 20,
+) -> int:
+    """Reverse encrypt_stream; returns bytes written"""
+    buffer: bytearray = bytearray(chunk_size)
+    view: memoryview = memoryview(buffer)
+    total: int = 0
+    while True:
+        read: int = cipher_in.readinto(buffer)
+        if not read:
+            return total
+        key: bytes = key_in.read(read)
+        if len(key) != read:
+            raise ValueError("Key is shorter than the ciphertext")
+        plain_out.write(xor_bytes(view[:read], key))
+        total += read
+
+
+def encrypt_file(
+    path: str, cipher_path: str, key_path: str, chunk_size: int = 1 << 20
+) -> int:
+    with open(path, "rb") as source, open(cipher_path, "wb") as cipher_out, open(
+        key_path, "wb"
+    ) as key_out:
+        return encrypt_stream(source, cipher_out, key_out, chunk_size)
+
+
+def decrypt_file(
+    cipher_path: str, key_path: str, path: str, chunk_size: int = 1 << 20
+) -> int:
+    with open(cipher_path, "rb") as cipher_in, open(key_path, "rb") as key_in, open(
+        path, "wb"
+    ) as plain_out:
+        return decrypt_stream(cipher_in, key_in, plain_out, chunk_size)
+
+
 if __name__ == "__main__":
     msg: str = " ".join(sys.argv[1:])
     print(f"Plaintext: {msg}")
     cipher_text, key = encrypt(msg)
     print(f"Ciphertext: {cipher_text}")
-    print(f"Key:        {key}")
+    print(f"Key:        {key.hex()}")
     decrypted = decrypt(cipher_text, key)
     print(f"Decrypted: {decrypted}")
@@ -1,6 +1,8 @@
-from typing import Generic, List, Tuple, TypeVar
+from array import array
+from typing import Dict, Generic, Iterable, List, Tuple, TypeVar
 
-from edge import WeightedEdge
+from csr_graph import WeightedCSRGraph
+from edge import EdgeStore, WeightedEdge
 from graph import Graph
 
 
@@ -9,24 +11,70 @@ V = TypeVar("V")
 
 class WeightedGraph(Generic[V], Graph[V]):
     def __init__(self, vertices: List[V] = []) -> None:
-        self._vertices: List[V] = vertices
-        self._edges: List[List[WeightedEdge]] = [[] for _ in vertices]
+        super().__init__(vertices)
+        self._store: EdgeStore = EdgeStore(weighted=True)
+
+    @classmethod
+    def from_edges(
+        cls, edges: Iterable[Tuple[V, V, float]], vertices: Iterable[V] = ()
+    ) -> "WeightedGraph[V]":
+        """Build a graph from (first, second, weight) triples in a single pass
+
+        Vertices are added in order of first appearance, after ``vertices``.
+        """
+        graph: WeightedGraph[V] = cls(vertices)
+        indices: Dict[V, int] = graph._indices
+        for first, second, weight in edges:
+            u = indices.get(first)
+            if u is None:
+                u = graph.add_vertex(first)
+            v = indices.get(second)
+            if v is None:
+                v = graph.add_vertex(second)
+            graph._link(u, v, weight)
+        return graph
+
+    def add_edge(self, edge: WeightedEdge) -> None:
+        self.add_edge_by_indices(edge.u, edge.v, edge.weight)
 
     def add_edge_by_indices(self, u: int, v: int, w: float) -> None:
-        edge: WeightedEdge = WeightedEdge(u=u, v=v, weight=w)
-        self._edges[u].append(edge)
-        self._edges[v].append(edge.reversed())
+        self._link(u, v, w)
+        self._version += 1
 
     def add_edge_by_vertices(self, first: V, second: V, weight: float) -> None:
         u = self.index_of(first)
         v = self.index_of(second)
         self.add_edge_by_indices(u, v, weight)
 
+    def neighbor_weights(self, index: int) -> List[float]:
+        """Edge weights parallel to ``neighbor_indices(index)``"""
+        weights: array = self._store.weights
+        return [weights[e] for e in self._edge_ids[index]]
+
+    def edges_for_index(self, index: int) -> List[WeightedEdge]:
+        return [
+            WeightedEdge(index, v, w)
+            for v, w in zip(self._neighbors[index], self.neighbor_weights(index))
+        ]
+
     def neighbors_for_index_with_weights(self, index: int) -> List[Tuple[V, float]]:
-        distance_tuples: List[Tuple[V, float]] = []
-        for edge in self.edges_for_index(index):
-            distance_tuples.append((self.vertex_at(edge.v), edge.weight))
-        return distance_tuples
+        vertices: List[V] = self._vertices
+        return [
+            (vertices[v], w)
+            for v, w in zip(self._neighbors[index], self.neighbor_weights(index))
+        ]
+
+    def freeze(self) -> WeightedCSRGraph[V]:
+        """Return an immutable, array-backed snapshot of this graph"""
+        offsets: array = array("q", [0])
+        neighbors: array = array("q")
+        weights: array = array("d")
+        store_weights: array = self._store.weights
+        for adjacent, edge_ids in zip(self._neighbors, self._edge_ids):
+            neighbors.extend(adjacent)
+            weights.extend([store_weights[e] for e in edge_ids])
+            offsets.append(len(neighbors))
+        return WeightedCSRGraph(self._vertices, offsets, neighbors, weights)
 
     def __str__(self) -> str:
         desc: str = ""